@@ -1,23 +1,35 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import HTMLResponse, PlainTextResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from core import CodeAnalyzer, DocumentationGenerator
+from core import CodeAnalyzer, DocumentationGenerator, init_worker_analyzer, analyze_in_worker
 from models import (
     CodeAnalysisRequest, CodeAnalysisResponse, 
     DocumentationRequest, DocumentationResponse,
     HealthResponse
 )
 import uvicorn
+import asyncio
+import codecs
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any
 
+# Size of the chunks read from uploaded files while decoding
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Documentation formats accepted by /documentation, matched case-insensitively
+DOC_FORMATS = ("markdown", "html", "json")
+
 # Initialize FastAPI app with metadata
 app = FastAPI(
     title="Code Analysis and Documentation Generator",
     description="Advanced code analysis and documentation generation using transformer models and tree-sitter parsing",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -36,6 +48,50 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 code_analyzer = CodeAnalyzer()
 doc_generator = DocumentationGenerator()
 
+@app.on_event("startup")
+async def start_analysis_pool():
+    """Start the worker processes that run CPU-bound analysis off the event loop"""
+    # Workers parse and lint only; summaries are generated in this process (see run_analysis)
+    if "fork" in multiprocessing.get_all_start_methods():
+        app.state.pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=init_worker_analyzer,
+            initargs=(code_analyzer,)
+        )
+    else:
+        app.state.pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=init_worker_analyzer
+        )
+
+@app.on_event("shutdown")
+async def stop_analysis_pool():
+    """Shut down the analysis worker processes"""
+    app.state.pool.shutdown()
+
+async def run_analysis(code: str, filename: str = None) -> Dict[str, Any]:
+    """Analyze code in the worker pool without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(app.state.pool, analyze_in_worker, code, filename, False)
+    if 'error' not in result and result['summary'] is None:
+        # Summarizing here, on threads, lets concurrent requests share one batched model call;
+        # the analyzer's summary cache answers repeats of the same code without the model
+        result['summary'] = await loop.run_in_executor(None, code_analyzer.generate_summary, code)
+    return result
+
+async def read_upload_text(file: UploadFile) -> str:
+    """Decode an uploaded file as UTF-8 chunk by chunk instead of buffering the raw bytes"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = []
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
 @app.get("/", response_class=HTMLResponse)
 async def serve_web_interface():
     """Serve the web interface HTML file"""
@@ -48,7 +104,7 @@ async def serve_web_interface():
             status_code=404
         )
 
-@app.get("/api", response_model=Dict[str, str])
+@app.get("/api")
 async def api_info():
     """API information endpoint"""
     return {
@@ -69,38 +125,38 @@ async def api_info():
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
+    # Answered from this process so probes never queue behind analyses in the pool
     return HealthResponse(
         status="healthy",
         version="1.0.0",
         models_loaded={
-            "summarizer": code_analyzer.summarizer is not None,
+            "summarizer": code_analyzer.summarizer_loaded,
             "tokenizer": code_analyzer.tokenizer is not None,
             "code_model": code_analyzer.code_model is not None
         }
     )
 
-@app.post("/analyze", response_model=Dict[str, Any])
+@app.post("/analyze")
 async def analyze_code_file(file: UploadFile = File(...)):
     """Analyze uploaded code file"""
     try:
-        content = await file.read()
-        code_str = content.decode("utf-8")
-        analysis_result = code_analyzer.analyze_code_file(code_str, file.filename)
-        return analysis_result
+        code_str = await read_upload_text(file)
+        analysis_result = await run_analysis(code_str, file.filename)
+        return ORJSONResponse(content=analysis_result)
     except UnicodeDecodeError:
         raise HTTPException(status_code=400, detail="File must be text-based and UTF-8 encoded")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-@app.post("/analyze/code", response_model=Dict[str, Any])
+@app.post("/analyze/code")
 async def analyze_code_text(request: CodeAnalysisRequest):
     """Analyze code provided as text"""
     try:
-        analysis_result = code_analyzer.analyze_code_file(
+        analysis_result = await run_analysis(
             request.code, 
             request.filename
         )
-        return analysis_result
+        return ORJSONResponse(content=analysis_result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -110,21 +166,26 @@ async def generate_documentation_file(
     format: str = "markdown"
 ):
     """Generate documentation from uploaded code file"""
+    format = format.lower()
+    if format not in DOC_FORMATS:
+        raise HTTPException(status_code=422, detail=f"Unsupported format: {format}")
+    
     try:
-        content = await file.read()
-        code_str = content.decode("utf-8")
+        code_str = await read_upload_text(file)
         
         # First analyze the code
-        analysis_result = code_analyzer.analyze_code_file(code_str, file.filename)
+        analysis_result = await run_analysis(code_str, file.filename)
+        
+        # JSON is already returned as analysis result with extra fields, no rendering needed
+        if format == "json":
+            return ORJSONResponse(content=analysis_result)
         
         # Then generate documentation
         documentation = doc_generator.generate_documentation(analysis_result, format)
         
         # Return appropriate response type based on format
-        if format.lower() == "html":
+        if format == "html":
             return HTMLResponse(content=documentation, media_type="text/html")
-        elif format.lower() == "json":
-            return analysis_result  # JSON is already returned as analysis result with extra fields
         else:  # markdown
             return PlainTextResponse(content=documentation, media_type="text/plain")
             
@@ -138,7 +199,7 @@ async def generate_documentation_text(request: DocumentationRequest):
     """Generate documentation from code provided as text"""
     try:
         # First analyze the code
-        analysis_result = code_analyzer.analyze_code_file(
+        analysis_result = await run_analysis(
             request.code, 
             request.filename
         )
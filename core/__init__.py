@@ -1,5 +1,5 @@
-from .analyzer import CodeAnalyzer, CodeElement
+from .analyzer import CodeAnalyzer, CodeElement, init_worker_analyzer, analyze_in_worker
 from .documentation import DocumentationGenerator
 from .error_detector import ErrorDetector, CodeError
 
-__all__ = ['CodeAnalyzer', 'CodeElement', 'DocumentationGenerator', 'ErrorDetector', 'CodeError']
+__all__ = ['CodeAnalyzer', 'CodeElement', 'init_worker_analyzer', 'analyze_in_worker', 'DocumentationGenerator', 'ErrorDetector', 'CodeError']
@@ -1,33 +1,145 @@
 import ast
+import copy
+import hashlib
+import queue
 import re
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+from dataclasses import dataclass, field
+from itertools import repeat
 import tree_sitter_python as tspython
 import tree_sitter_javascript as tsjavascript
 import tree_sitter_java as tsjava
 import tree_sitter_cpp as tscpp
 from tree_sitter import Language, Parser, Node
+import torch
 from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
 from .error_detector import ErrorDetector
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeElement:
     """Represents a code element (function, class, variable, etc.)"""
     name: str
     type: str  # 'function', 'class', 'variable', 'import', etc.
     description: str
-    parameters: List[str] = None
-    return_type: str = None
+    parameters: List[str] = field(default_factory=list)
+    return_type: Optional[str] = None
     complexity: int = 0
     line_start: int = 0
     line_end: int = 0
-    docstring: str = None
+    docstring: Optional[str] = None
+
+
+class SummaryBatcher:
+    """Collect summarization prompts from concurrent callers and run them as one batch"""
+    
+    def __init__(self, summarizer, max_batch_size: int = 8, max_wait: float = 0.01):
+        self.summarizer = summarizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="summary-batcher", daemon=True)
+        self._worker.start()
+    
+    def submit(self, prompt: str) -> str:
+        """Queue a prompt and block until its summary is available"""
+        future = Future()
+        self._queue.put((prompt, future))
+        return future.result()
+    
+    def _collect_batch(self) -> List[tuple]:
+        """Wait for one item, then gather more until the batch is full or the wait expires"""
+        items = [self._queue.get()]
+        while len(items) < self.max_batch_size:
+            try:
+                items.append(self._queue.get(timeout=self.max_wait))
+            except queue.Empty:
+                break
+        return items
+    
+    def _run(self):
+        """Worker loop: summarize queued prompts in batches and resolve their futures"""
+        while True:
+            items = self._collect_batch()
+            prompts = [prompt for prompt, _ in items]
+            try:
+                results = self.summarizer(
+                    prompts,
+                    batch_size=len(prompts),
+                    max_length=150,
+                    min_length=30,
+                    do_sample=False,
+                    num_beams=1,
+                    truncation=True
+                )
+                for (_, future), result in zip(items, results):
+                    future.set_result(result['summary_text'])
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
 
 
 class CodeAnalyzer:
     """Advanced code analyzer using tree-sitter and transformer models"""
     
+    # Maximum number of analysis results kept in the content-addressed cache
+    ANALYSIS_CACHE_SIZE = 256
+    
+    # Maximum number of model summaries kept, keyed by content hash
+    SUMMARY_CACHE_SIZE = 256
+    
+    # Distilled BART checkpoint used for code summarization
+    SUMMARIZATION_MODEL = "sshleifer/distilbart-cnn-12-6"
+    
+    # Code tokens fed to the summarizer; leaves room for the prompt within BART's 1024 limit
+    SUMMARY_MAX_INPUT_TOKENS = 900
+    
+    # Inputs below these sizes are not worth a summarizer forward pass
+    MIN_SUMMARY_CHARS = 80
+    MIN_SUMMARY_LINES = 10
+    SHORT_CODE_SUMMARY = "Short code snippet; no summary generated."
+    
+    # Node types captured by the per-language tree-sitter queries
+    FUNCTION_NODE_TYPES = {
+        'python': 'function_definition',
+        'javascript': 'function_declaration',
+    }
+    CLASS_NODE_TYPES = {
+        'python': 'class_definition',
+        'java': 'class_declaration',
+    }
+    BRANCH_NODE_TYPES = (
+        'if_statement', 'while_statement', 'for_statement',
+        'try_statement', 'case_statement', 'conditional_expression',
+    )
+    
+    # File extension (without the dot) to language
+    EXTENSION_MAP = {
+        'py': 'python',
+        'js': 'javascript',
+        'ts': 'javascript',  # TypeScript treated as JavaScript for now
+        'java': 'java',
+        'cpp': 'cpp',
+        'cc': 'cpp',
+        'cxx': 'cpp',
+        'c': 'cpp'
+    }
+    
+    # Substrings used for content-based language detection
+    PYTHON_MARKERS = frozenset({'def ', 'import '})
+    JAVASCRIPT_MARKERS = frozenset({'function ', 'const ', 'let '})
+    JAVA_MARKERS = frozenset({'public class ', 'private '})
+    CPP_MARKERS = frozenset({'#include', 'std::'})
+    # Zero-width lookahead so overlapping markers (e.g. '#includef ') are all seen
+    CONTENT_MARKERS = re.compile('(?=(' + '|'.join(
+        re.escape(marker)
+        for markers in (PYTHON_MARKERS, JAVASCRIPT_MARKERS, JAVA_MARKERS, CPP_MARKERS)
+        for marker in sorted(markers)
+    ) + '))')
+    
     def __init__(self):
         # Initialize language parsers
         self.languages = {
@@ -37,155 +149,251 @@ class CodeAnalyzer:
             'cpp': Language(tscpp.language()),
         }
         
-        # Initialize transformer models for different tasks
-        self.summarizer = None
+        # One query per language replaces the recursive Python traversals
+        self.queries = {lang: self._build_query(lang) for lang in self.languages}
+        self.complexity_queries = {
+            lang: self._build_query(lang, branches_only=True) for lang in self.languages
+        }
+        
+        # Parsers are reused across calls; they are not thread-safe, so each thread gets its own
+        self._parser_local = threading.local()
+        
+        # Initialize transformer models for different tasks.
+        # The summarizer is loaded lazily on first use (see the summarizer property).
+        self._summarizer = None
+        self._summarizer_failed = False
+        self._summarizer_lock = threading.Lock()
+        self._summary_batcher = None
         self.code_model = None
         self.tokenizer = None
         
         # Initialize error detector
         self.error_detector = ErrorDetector()
         
+        # Analysis results keyed by (content hash, language), in LRU order
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+        
+        # Model summaries keyed by content hash, in LRU order; callers that analyze
+        # with summarize=False and summarize separately (the API server) rely on it
+        self._summary_cache = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
+        
         self._initialize_models()
     
     def _initialize_models(self):
         """Initialize transformer models for code analysis"""
+        # Summarization model is deferred until the first summary is requested
+        # Skip CodeBERT for now as it's complex to set up
+        self.tokenizer = None
+        self.code_model = None
+        print("ℹ Code-specific models skipped for this demo")
+    
+    def _load_summarizer(self):
+        """Load the summarization pipeline"""
         try:
-            # For code summarization - use a smaller, more reliable model
-            self.summarizer = pipeline(
+            # For code summarization - a distilled model with int8 linear layers
+            tokenizer = AutoTokenizer.from_pretrained(self.SUMMARIZATION_MODEL)
+            model = AutoModelForSeq2SeqLM.from_pretrained(self.SUMMARIZATION_MODEL, low_cpu_mem_usage=True)
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            
+            summarizer = pipeline(
                 "summarization", 
-                model="facebook/bart-large-cnn",
+                model=model,
+                tokenizer=tokenizer,
                 max_length=150,
                 min_length=30,
                 do_sample=False
             )
             print("✓ Summarization model loaded successfully")
+            return summarizer
             
         except Exception as e:
             print(f"Warning: Could not initialize summarization model: {e}")
-            self.summarizer = None
-            
-        # Skip CodeBERT for now as it's complex to set up
-        self.tokenizer = None
-        self.code_model = None
-        print("ℹ Code-specific models skipped for this demo")
+            return None
+    
+    @property
+    def summarizer(self):
+        """Summarization pipeline, loaded on first access"""
+        if self._summarizer is None and not self._summarizer_failed:
+            with self._summarizer_lock:
+                if self._summarizer is None and not self._summarizer_failed:
+                    self._summarizer = self._load_summarizer()
+                    self._summarizer_failed = self._summarizer is None
+        return self._summarizer
+    
+    @property
+    def summary_batcher(self) -> Optional[SummaryBatcher]:
+        """Batcher feeding the summarizer, started alongside the model"""
+        if self._summary_batcher is None:
+            summarizer = self.summarizer
+            if summarizer is None:
+                return None
+            with self._summarizer_lock:
+                if self._summary_batcher is None:
+                    self._summary_batcher = SummaryBatcher(summarizer)
+        return self._summary_batcher
+    
+    def share_models(self):
+        """Load the summarizer and move its weights into shared memory before forking workers"""
+        summarizer = self.summarizer
+        if summarizer is None:
+            return
+        
+        try:
+            summarizer.model.share_memory()
+            print("✓ Summarization model moved to shared memory")
+        except Exception as e:
+            print(f"Warning: Could not share summarization model memory: {e}")
+    
+    def reset_after_fork(self):
+        """Drop state a forked child inherits but cannot use: the parent's batcher thread and its locks"""
+        # The batcher's worker thread does not exist in the child; a new one starts on first use
+        self._summary_batcher = None
+        self._summarizer_lock = threading.Lock()
+        self._analysis_cache_lock = threading.Lock()
+        self._summary_cache_lock = threading.Lock()
+        self.error_detector.reset_after_fork()
+    
+    @property
+    def summarizer_loaded(self) -> bool:
+        """Whether the summarization pipeline has been loaded, without triggering a load"""
+        return self._summarizer is not None
     
     def detect_language(self, code: str, filename: str = None) -> str:
         """Detect programming language from code content or filename"""
         if filename:
-            extension = filename.split('.')[-1].lower()
-            extension_map = {
-                'py': 'python',
-                'js': 'javascript',
-                'ts': 'javascript',  # TypeScript treated as JavaScript for now
-                'java': 'java',
-                'cpp': 'cpp',
-                'cc': 'cpp',
-                'cxx': 'cpp',
-                'c': 'cpp'
-            }
-            if extension in extension_map:
-                return extension_map[extension]
+            extension = filename.rpartition('.')[2].lower()
+            language = self.EXTENSION_MAP.get(extension)
+            if language:
+                return language
         
-        # Fallback to content-based detection
-        if 'def ' in code and 'import ' in code:
+        # Fallback to content-based detection, collecting every marker in one pass
+        found = set()
+        for match in self.CONTENT_MARKERS.finditer(code):
+            found.add(match.group(1))
+            if self.PYTHON_MARKERS <= found:
+                break
+        
+        if self.PYTHON_MARKERS <= found:
             return 'python'
-        elif 'function ' in code or 'const ' in code or 'let ' in code:
+        elif found & self.JAVASCRIPT_MARKERS:
             return 'javascript'
-        elif 'public class ' in code or 'private ' in code:
+        elif found & self.JAVA_MARKERS:
             return 'java'
-        elif '#include' in code or 'std::' in code:
+        elif found & self.CPP_MARKERS:
             return 'cpp'
         
         return 'python'  # Default
     
-    def parse_code(self, code: str, language: str) -> Node:
-        """Parse code using tree-sitter"""
+    def _get_parser(self, language: str) -> Parser:
+        """Return this thread's cached parser for a language, creating it on first use"""
+        parsers = getattr(self._parser_local, 'parsers', None)
+        if parsers is None:
+            parsers = self._parser_local.parsers = {}
+        
+        parser = parsers.get(language)
+        if parser is None:
+            parser = parsers[language] = Parser(self.languages[language])
+        return parser
+    
+    def parse_code(self, code_bytes: bytes, language: str) -> Node:
+        """Parse UTF-8 encoded code using tree-sitter"""
         if language not in self.languages:
             raise ValueError(f"Unsupported language: {language}")
         
-        parser = Parser(self.languages[language])
-        tree = parser.parse(bytes(code, "utf8"))
+        parser = self._get_parser(language)
+        tree = parser.parse(code_bytes)
         return tree.root_node
     
-    def extract_functions(self, node: Node, code_bytes: bytes, language: str) -> List[CodeElement]:
+    def _build_query(self, language: str, branches_only: bool = False):
+        """Build the tree-sitter query capturing functions, classes and branch nodes"""
+        patterns = []
+        if not branches_only and language in self.FUNCTION_NODE_TYPES:
+            patterns.append(f"({self.FUNCTION_NODE_TYPES[language]}) @function")
+        if not branches_only and language in self.CLASS_NODE_TYPES:
+            patterns.append(f"({self.CLASS_NODE_TYPES[language]}) @class")
+        
+        # Only reference node types the grammar actually defines
+        lang = self.languages[language]
+        branch_types = [t for t in self.BRANCH_NODE_TYPES if lang.id_for_node_kind(t, True)]
+        if branch_types:
+            patterns.append("[" + " ".join(f"({t})" for t in branch_types) + "] @branch")
+        
+        return lang.query("\n".join(patterns))
+    
+    def capture_nodes(self, node: Node, language: str, query=None) -> Dict[str, List[Node]]:
+        """Run the language query once and group captured nodes by capture name"""
+        if query is None:
+            query = self.queries[language]
+        captures = query.captures(node)
+        if isinstance(captures, dict):
+            return captures
+        
+        grouped = {}
+        for captured_node, name in captures:
+            grouped.setdefault(name, []).append(captured_node)
+        return grouped
+    
+    def extract_functions(self, node: Node, code_bytes: bytes, language: str,
+                          captures: Dict[str, List[Node]] = None) -> List[CodeElement]:
         """Extract function definitions from AST"""
-        functions = []
+        if captures is None:
+            captures = self.capture_nodes(node, language)
         
-        def traverse(node):
-            if language == 'python' and node.type == 'function_definition':
-                func_name = self._get_node_text(node.child_by_field_name('name'), code_bytes)
-                parameters = self._extract_python_parameters(node, code_bytes)
-                docstring = self._extract_python_docstring(node, code_bytes)
-                
-                functions.append(CodeElement(
-                    name=func_name,
-                    type='function',
-                    description=f"Function: {func_name}",
-                    parameters=parameters,
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1,
-                    docstring=docstring
-                ))
+        functions = []
+        for func_node in captures.get('function', []):
+            func_name = self._get_node_text(func_node.child_by_field_name('name'), code_bytes)
             
-            elif language == 'javascript' and node.type == 'function_declaration':
-                func_name = self._get_node_text(node.child_by_field_name('name'), code_bytes)
-                parameters = self._extract_js_parameters(node, code_bytes)
-                
-                functions.append(CodeElement(
-                    name=func_name,
-                    type='function',
-                    description=f"Function: {func_name}",
-                    parameters=parameters,
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1
-                ))
+            if language == 'python':
+                parameters = self._extract_python_parameters(func_node, code_bytes)
+                docstring = self._extract_python_docstring(func_node, code_bytes)
+            else:
+                parameters = self._extract_js_parameters(func_node, code_bytes)
+                docstring = None
             
-            for child in node.children:
-                traverse(child)
+            functions.append(CodeElement(
+                name=func_name,
+                type='function',
+                description=f"Function: {func_name}",
+                parameters=parameters,
+                line_start=func_node.start_point[0] + 1,
+                line_end=func_node.end_point[0] + 1,
+                docstring=docstring
+            ))
         
-        traverse(node)
         return functions
     
-    def extract_classes(self, node: Node, code_bytes: bytes, language: str) -> List[CodeElement]:
+    def extract_classes(self, node: Node, code_bytes: bytes, language: str,
+                        captures: Dict[str, List[Node]] = None) -> List[CodeElement]:
         """Extract class definitions from AST"""
-        classes = []
+        if captures is None:
+            captures = self.capture_nodes(node, language)
         
-        def traverse(node):
-            if language == 'python' and node.type == 'class_definition':
-                class_name = self._get_node_text(node.child_by_field_name('name'), code_bytes)
-                docstring = self._extract_python_docstring(node, code_bytes)
-                
-                classes.append(CodeElement(
-                    name=class_name,
-                    type='class',
-                    description=f"Class: {class_name}",
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1,
-                    docstring=docstring
-                ))
-            
-            elif language == 'java' and node.type == 'class_declaration':
-                class_name = self._get_node_text(node.child_by_field_name('name'), code_bytes)
-                
-                classes.append(CodeElement(
-                    name=class_name,
-                    type='class',
-                    description=f"Class: {class_name}",
-                    line_start=node.start_point[0] + 1,
-                    line_end=node.end_point[0] + 1
-                ))
+        classes = []
+        for class_node in captures.get('class', []):
+            class_name = self._get_node_text(class_node.child_by_field_name('name'), code_bytes)
+            docstring = None
+            if language == 'python':
+                docstring = self._extract_python_docstring(class_node, code_bytes)
             
-            for child in node.children:
-                traverse(child)
+            classes.append(CodeElement(
+                name=class_name,
+                type='class',
+                description=f"Class: {class_name}",
+                line_start=class_node.start_point[0] + 1,
+                line_end=class_node.end_point[0] + 1,
+                docstring=docstring
+            ))
         
-        traverse(node)
         return classes
     
-    def _get_node_text(self, node: Node, code_bytes: bytes) -> str:
+    def _get_node_text(self, node: Node, code_bytes: Union[bytes, memoryview]) -> str:
         """Get text content of a tree-sitter node"""
         if node is None:
             return ""
-        return code_bytes[node.start_byte:node.end_byte].decode('utf8')
+        # Slicing a memoryview is a view, so the text is decoded straight from the source buffer
+        return str(code_bytes[node.start_byte:node.end_byte], 'utf8')
     
     def _extract_python_parameters(self, func_node: Node, code_bytes: bytes) -> List[str]:
         """Extract parameter names from Python function"""
@@ -216,67 +424,142 @@ class CodeAnalyzer:
                 expr = first_stmt.children[0]
                 if expr.type == 'string':
                     docstring = self._get_node_text(expr, code_bytes)
-                    # Remove quotes
-                    return docstring.strip('"""').strip("'''").strip('"').strip("'").strip()
+                    return self._strip_string_quotes(docstring)
         return None
     
-    def calculate_complexity(self, node: Node) -> int:
+    def _strip_string_quotes(self, literal: str) -> str:
+        """Remove the prefix and surrounding quotes from a Python string literal"""
+        text = literal.lstrip('rRbBuUfF')
+        for quote in ('"""', "'''", '"', "'"):
+            if len(text) >= 2 * len(quote) and text.startswith(quote) and text.endswith(quote):
+                return text[len(quote):-len(quote)].strip()
+        return text.strip()
+    
+    def calculate_complexity(self, node: Node, language: str,
+                             captures: Dict[str, List[Node]] = None) -> int:
         """Calculate cyclomatic complexity of code"""
-        complexity = 1  # Base complexity
+        if captures is None:
+            # Standalone calls only need branch nodes, not functions and classes
+            captures = self.capture_nodes(node, language, self.complexity_queries[language])
         
-        def traverse(node):
-            nonlocal complexity
-            if node.type in ['if_statement', 'while_statement', 'for_statement', 
-                           'try_statement', 'case_statement', 'conditional_expression']:
-                complexity += 1
-            
-            for child in node.children:
-                traverse(child)
+        # Base complexity plus one per branch node
+        return 1 + len(captures.get('branch', []))
+    
+    def _walk_once(self, root_node: Node, code_bytes: bytes,
+                   language: str) -> Tuple[List[CodeElement], List[CodeElement], int]:
+        """Collect functions, classes and complexity from a single query pass over the tree"""
+        captures = self.capture_nodes(root_node, language)
         
-        traverse(node)
-        return complexity
+        functions = self.extract_functions(root_node, code_bytes, language, captures)
+        classes = self.extract_classes(root_node, code_bytes, language, captures)
+        complexity = self.calculate_complexity(root_node, language, captures)
+        return functions, classes, complexity
     
     def generate_summary(self, code: str) -> str:
         """Generate a summary of the code using transformer model"""
-        if not self.summarizer:
+        # Tiny snippets give the model nothing to summarize; don't load or run it
+        if len(code.strip()) < self.MIN_SUMMARY_CHARS or code.count('\n') < 3:
+            return self.SHORT_CODE_SUMMARY
+        
+        # Repeat submissions of the same code reuse the model's earlier summary
+        digest = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+        with self._summary_cache_lock:
+            summary = self._summary_cache.get(digest)
+            if summary is not None:
+                self._summary_cache.move_to_end(digest)
+                return summary
+        
+        batcher = self.summary_batcher
+        if batcher is None:
             return "Code analysis complete. Summary generation unavailable."
         
         try:
-            # Truncate code if too long
-            max_length = 1024
-            if len(code) > max_length:
-                code = code[:max_length] + "..."
+            # Truncate code if too long, measured in model tokens rather than characters
+            tokenizer = self.summarizer.tokenizer
+            token_ids = tokenizer(
+                code,
+                add_special_tokens=False,
+                truncation=True,
+                max_length=self.SUMMARY_MAX_INPUT_TOKENS + 1
+            )['input_ids']
+            if len(token_ids) > self.SUMMARY_MAX_INPUT_TOKENS:
+                code = tokenizer.decode(token_ids[:self.SUMMARY_MAX_INPUT_TOKENS]) + "..."
             
             # Add context to help the model understand it's code
             prompt = f"This is a code snippet:\n{code}\n\nSummary:"
             
-            result = self.summarizer(prompt, max_length=150, min_length=30, do_sample=False)
-            return result[0]['summary_text']
+            # Concurrent requests are summarized together in one model call
+            summary = batcher.submit(prompt)
         except Exception as e:
             return f"Error generating summary: {str(e)}"
+        
+        with self._summary_cache_lock:
+            self._summary_cache[digest] = summary
+            if len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
+    
+    def _cache_key(self, code: str, language: str, summarize: bool = True) -> tuple:
+        """Build the analysis cache key from the code content, language and whether it was summarized"""
+        digest = hashlib.blake2b(code.encode('utf-8'), digest_size=16).hexdigest()
+        return (digest, language, summarize)
     
-    def analyze_code_file(self, code: str, filename: str = None) -> Dict[str, Any]:
-        """Comprehensive analysis of a code file"""
+    def _get_cached_analysis(self, key: tuple, filename: str = None) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a cached analysis result with the filename patched in"""
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is None:
+                return None
+            self._analysis_cache.move_to_end(key)
+        
+        # Callers may edit what they get back; nested lists and dicts must not be the cache's own
+        result = copy.deepcopy(cached)
+        result['filename'] = filename
+        result['error_analysis']['filename'] = filename
+        return result
+    
+    def _store_cached_analysis(self, key: tuple, result: Dict[str, Any]):
+        """Store an analysis result, evicting the least recently used entry if full"""
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
+    def analyze_code_file(self, code: str, filename: str = None, language: str = None,
+                          summarize: bool = True, error_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Comprehensive analysis of a code file; pass language to skip detection, summarize=False to leave the summary to the caller"""
         try:
-            language = self.detect_language(code, filename)
+            language = language or self.detect_language(code, filename)
+            
+            # Identical code is analyzed once; repeat submissions hit the cache
+            cache_key = self._cache_key(code, language, summarize)
+            cached = self._get_cached_analysis(cache_key, filename)
+            if cached is not None:
+                return cached
+            
             code_bytes = bytes(code, "utf8")
-            root_node = self.parse_code(code, language)
+            root_node = self.parse_code(code_bytes, language)
             
-            # Extract code elements
-            functions = self.extract_functions(root_node, code_bytes, language)
-            classes = self.extract_classes(root_node, code_bytes, language)
+            # Extract code elements and complexity in one pass over the tree
+            functions, classes, complexity = self._walk_once(root_node, memoryview(code_bytes), language)
             
             # Calculate metrics
-            complexity = self.calculate_complexity(root_node)
-            line_count = len(code.split('\n'))
+            line_count = code.count('\n') + 1
             
-            # Generate summary
-            summary = self.generate_summary(code)
+            # Generate summary (skipped for trivial code with no definitions)
+            if not functions and not classes and line_count < self.MIN_SUMMARY_LINES:
+                summary = self.SHORT_CODE_SUMMARY
+            elif summarize:
+                summary = self.generate_summary(code)
+            else:
+                summary = None
             
-            # Perform error analysis
-            error_analysis = self.error_detector.analyze_errors(code, language, filename)
+            # Perform error analysis, unless a batch already did
+            if error_analysis is None:
+                error_analysis = self.error_detector.analyze_errors(code, language, filename)
             
-            return {
+            result = {
                 'language': language,
                 'line_count': line_count,
                 'complexity': complexity,
@@ -305,6 +588,9 @@ class CodeAnalyzer:
                 'has_errors': error_analysis['has_errors'],
                 'filename': filename
             }
+            
+            self._store_cached_analysis(cache_key, result)
+            return copy.deepcopy(result)
         
         except Exception as e:
             return {
@@ -312,11 +598,39 @@ class CodeAnalyzer:
                 'filename': filename
             }
     
-    def comprehensive_analysis(self, code: str, filename: str = None, auto_fix: bool = False) -> Dict[str, Any]:
+    def analyze_code_files(self, files: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Analyze several (code, filename) pairs, linting the uncached Python sources in one batch"""
+        languages = [self.detect_language(code, filename) for code, filename in files]
+        results = [
+            self._get_cached_analysis(self._cache_key(code, language), filename)
+            for (code, filename), language in zip(files, languages)
+        ]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+        codes = [files[index][0] for index in misses]
+        filenames = [files[index][1] for index in misses]
+        miss_languages = [languages[index] for index in misses]
+        
+        # One batched error pass over the misses; each file's analysis below takes its share
+        error_analyses = self.error_detector.analyze_errors_many(list(zip(codes, miss_languages)), filenames)
+        
+        # Files are analyzed concurrently so their summaries reach the batcher together;
+        # eight threads match the batcher's default batch size
+        with ThreadPoolExecutor(max_workers=min(len(misses), 8)) as pool:
+            analyzed = pool.map(
+                self.analyze_code_file, codes, filenames, miss_languages, repeat(True), error_analyses
+            )
+            for index, result in zip(misses, analyzed):
+                results[index] = result
+        return results
+    
+    def comprehensive_analysis(self, code: str, filename: str = None, auto_fix: bool = False,
+                               language: str = None) -> Dict[str, Any]:
         """Perform comprehensive code analysis with error detection, suggestions, and optional auto-fixing"""
         try:
             # Basic code analysis
-            basic_analysis = self.analyze_code_file(code, filename)
+            basic_analysis = self.analyze_code_file(code, filename, language)
             
             if 'error' in basic_analysis:
                 return basic_analysis
@@ -354,3 +668,22 @@ class CodeAnalyzer:
                 'error': f"Auto-fix failed: {str(e)}",
                 'filename': filename
             }
+
+
+# Per-process analyzer used when analysis runs in a ProcessPoolExecutor
+_worker_analyzer = None
+
+
+def init_worker_analyzer(analyzer: Optional[CodeAnalyzer] = None):
+    """ProcessPoolExecutor initializer: adopt the parent's forked analyzer or build a new one"""
+    global _worker_analyzer
+    # One worker per CPU; torch's own intra-op threads would oversubscribe them
+    torch.set_num_threads(1)
+    if analyzer is not None:
+        analyzer.reset_after_fork()
+    _worker_analyzer = analyzer if analyzer is not None else CodeAnalyzer()
+
+
+def analyze_in_worker(code: str, filename: str = None, summarize: bool = True) -> Dict[str, Any]:
+    """Analyze code with the worker process's CodeAnalyzer"""
+    return _worker_analyzer.analyze_code_file(code, filename, summarize=summarize)
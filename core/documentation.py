@@ -73,116 +73,157 @@ class DocumentationGenerator:
 </body>
 </html>"""
 
-    def generate_markdown_documentation(self, analysis_result: Dict[str, Any]) -> str:
-        """Generate Markdown documentation from analysis results"""
+    def _build_document(self, analysis_result: Dict[str, Any], now: datetime = None) -> Dict[str, Any]:
+        """Normalize analysis results into the fields shared by every documentation format"""
         if 'error' in analysis_result:
-            return f"# Error\n\n{analysis_result['error']}"
+            return {'error': analysis_result['error']}
+        
+        return {
+            'filename': analysis_result.get('filename', 'Unknown'),
+            'language': analysis_result.get('language', 'Unknown'),
+            'line_count': analysis_result.get('line_count', 0),
+            'complexity': analysis_result.get('complexity', 0),
+            'timestamp': (now or datetime.now()).strftime("%Y-%m-%d %H:%M:%S"),
+            'summary': analysis_result.get('summary', 'No summary available'),
+            'functions': [
+                {
+                    'name': func['name'],
+                    'type': func['type'],
+                    'params': ", ".join(func.get('parameters', [])) if func.get('parameters') else "None",
+                    'line_start': func['line_start'],
+                    'line_end': func['line_end'],
+                    'docstring': func.get('docstring', 'No documentation available')
+                }
+                for func in analysis_result.get('functions') or []
+            ],
+            'classes': [
+                {
+                    'name': cls['name'],
+                    'type': cls['type'],
+                    'line_start': cls['line_start'],
+                    'line_end': cls['line_end'],
+                    'docstring': cls.get('docstring', 'No documentation available')
+                }
+                for cls in analysis_result.get('classes') or []
+            ]
+        }
+    
+    def _render_markdown(self, document: Dict[str, Any]) -> str:
+        """Render a normalized document as Markdown"""
+        if 'error' in document:
+            return f"# Error\n\n{document['error']}"
         
+        # Sections are built with one str.join, which sizes the result once; reused StringIO buffers measured slower
         # Generate functions section
-        functions_section = ""
-        if analysis_result.get('functions'):
-            for func in analysis_result['functions']:
-                params = ", ".join(func.get('parameters', [])) if func.get('parameters') else "None"
-                docstring = func.get('docstring', 'No documentation available')
-                
-                functions_section += f"""
+        functions_section = "".join(
+            f"""
 ### {func['name']}()
 - **Type:** {func['type']}
-- **Parameters:** {params}
+- **Parameters:** {func['params']}
 - **Lines:** {func['line_start']}-{func['line_end']}
-- **Documentation:** {docstring}
+- **Documentation:** {func['docstring']}
 
 """
-        else:
-            functions_section = "No functions found.\n"
+            for func in document['functions']
+        ) or "No functions found.\n"
         
         # Generate classes section
-        classes_section = ""
-        if analysis_result.get('classes'):
-            for cls in analysis_result['classes']:
-                docstring = cls.get('docstring', 'No documentation available')
-                
-                classes_section += f"""
+        classes_section = "".join(
+            f"""
 ### {cls['name']}
 - **Type:** {cls['type']}
 - **Lines:** {cls['line_start']}-{cls['line_end']}
-- **Documentation:** {docstring}
+- **Documentation:** {cls['docstring']}
 
 """
-        else:
-            classes_section = "No classes found.\n"
+            for cls in document['classes']
+        ) or "No classes found.\n"
         
         return self.template_markdown.format(
-            filename=analysis_result.get('filename', 'Unknown'),
-            language=analysis_result.get('language', 'Unknown'),
-            line_count=analysis_result.get('line_count', 0),
-            complexity=analysis_result.get('complexity', 0),
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            summary=analysis_result.get('summary', 'No summary available'),
             functions_section=functions_section,
-            classes_section=classes_section
+            classes_section=classes_section,
+            **document
         )
     
-    def generate_html_documentation(self, analysis_result: Dict[str, Any]) -> str:
-        """Generate HTML documentation from analysis results"""
-        if 'error' in analysis_result:
-            return f"<html><body><h1>Error</h1><p>{analysis_result['error']}</p></body></html>"
+    def _render_html(self, document: Dict[str, Any]) -> str:
+        """Render a normalized document as HTML"""
+        if 'error' in document:
+            return f"<html><body><h1>Error</h1><p>{document['error']}</p></body></html>"
         
         # Generate functions section
-        functions_section = ""
-        if analysis_result.get('functions'):
-            for func in analysis_result['functions']:
-                params = ", ".join(func.get('parameters', [])) if func.get('parameters') else "None"
-                docstring = func.get('docstring', 'No documentation available')
-                
-                functions_section += f"""
+        functions_section = "".join(
+            f"""
         <div class="function">
             <h3>{func['name']}()</h3>
             <p><strong>Type:</strong> {func['type']}</p>
-            <p><strong>Parameters:</strong> {params}</p>
+            <p><strong>Parameters:</strong> {func['params']}</p>
             <p><strong>Lines:</strong> {func['line_start']}-{func['line_end']}</p>
-            <p><strong>Documentation:</strong> {docstring}</p>
+            <p><strong>Documentation:</strong> {func['docstring']}</p>
         </div>
 """
-        else:
-            functions_section = "<p>No functions found.</p>\n"
+            for func in document['functions']
+        ) or "<p>No functions found.</p>\n"
         
         # Generate classes section
-        classes_section = ""
-        if analysis_result.get('classes'):
-            for cls in analysis_result['classes']:
-                docstring = cls.get('docstring', 'No documentation available')
-                
-                classes_section += f"""
+        classes_section = "".join(
+            f"""
         <div class="class">
             <h3>{cls['name']}</h3>
             <p><strong>Type:</strong> {cls['type']}</p>
             <p><strong>Lines:</strong> {cls['line_start']}-{cls['line_end']}</p>
-            <p><strong>Documentation:</strong> {docstring}</p>
+            <p><strong>Documentation:</strong> {cls['docstring']}</p>
         </div>
 """
-        else:
-            classes_section = "<p>No classes found.</p>\n"
+            for cls in document['classes']
+        ) or "<p>No classes found.</p>\n"
         
         return self.template_html.format(
-            filename=analysis_result.get('filename', 'Unknown'),
-            language=analysis_result.get('language', 'Unknown'),
-            line_count=analysis_result.get('line_count', 0),
-            complexity=analysis_result.get('complexity', 0),
-            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            summary=analysis_result.get('summary', 'No summary available'),
             functions_section=functions_section,
-            classes_section=classes_section
+            classes_section=classes_section,
+            **document
         )
     
-    def generate_json_documentation(self, analysis_result: Dict[str, Any]) -> str:
-        """Generate JSON documentation from analysis results"""
-        doc_result = {
+    def _json_document(self, analysis_result: Dict[str, Any], now: datetime = None) -> Dict[str, Any]:
+        """Analysis results plus generator metadata, ready for JSON serialization"""
+        return {
             **analysis_result,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': (now or datetime.now()).isoformat(),
             'generator': 'Code Analysis and Documentation Generator'
         }
-        return json.dumps(doc_result, indent=2)
+    
+    def generate_markdown_documentation(self, analysis_result: Dict[str, Any]) -> str:
+        """Generate Markdown documentation from analysis results"""
+        return self._render_markdown(self._build_document(analysis_result))
+    
+    def generate_html_documentation(self, analysis_result: Dict[str, Any]) -> str:
+        """Generate HTML documentation from analysis results"""
+        return self._render_html(self._build_document(analysis_result))
+    
+    def generate_json_documentation(self, analysis_result: Dict[str, Any]) -> str:
+        """Generate JSON documentation from analysis results"""
+        return json.dumps(self._json_document(analysis_result), indent=2)
+    
+    def generate_all(self, analysis_result: Dict[str, Any],
+                     formats=('markdown', 'html', 'json')) -> Dict[str, Any]:
+        """Generate several formats from one normalized document; JSON is returned as an unserialized dict"""
+        now = datetime.now()
+        document = None
+        docs = {}
+        for format_type in formats:
+            format_type = format_type.lower()
+            if format_type == "json":
+                docs[format_type] = self._json_document(analysis_result, now)
+                continue
+            
+            if document is None:
+                document = self._build_document(analysis_result, now)
+            if format_type == "markdown":
+                docs[format_type] = self._render_markdown(document)
+            elif format_type == "html":
+                docs[format_type] = self._render_html(document)
+            else:
+                raise ValueError(f"Unsupported format: {format_type}")
+        return docs
     
     def generate_documentation(self, analysis_result: Dict[str, Any], format_type: str = "markdown") -> str:
         """Generate documentation in specified format"""
@@ -1,27 +1,41 @@
 import ast
+import copy
+import hashlib
+import io
+import json
 import re
 import sys
-import subprocess
 import tempfile
 import os
+import threading
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 # Import external tools with fallback
 try:
-    import pylint.lint
-    import pylint.reporters.text
+    import astroid
+    from pylint import __version__ as PYLINT_VERSION
+    from pylint.lint import Run as PylintRun
+    from pylint.reporters import JSONReporter
     PYLINT_AVAILABLE = True
 except ImportError:
     PYLINT_AVAILABLE = False
 
 try:
-    from flake8.api import legacy as flake8
-    FLAKE8_AVAILABLE = True
+    import pycodestyle  # Provides flake8's E-series style checks
+    PYCODESTYLE_AVAILABLE = True
 except ImportError:
-    FLAKE8_AVAILABLE = False
+    PYCODESTYLE_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeError:
     """Represents a code error or issue"""
     type: str  # 'syntax', 'logic', 'style', 'security', 'performance'
@@ -35,10 +49,152 @@ class CodeError:
     confidence: float = 0.0  # Confidence in the fix (0.0-1.0)
 
 
+if PYCODESTYLE_AVAILABLE:
+    class _StyleReport(pycodestyle.BaseReport):
+        """pycodestyle report that collects E-code violations as CodeErrors instead of printing"""
+        
+        def init_file(self, filename, lines, expected, line_offset):
+            super().init_file(filename, lines, expected, line_offset)
+            self.style_errors = []
+        
+        def error(self, line_number, offset, text, check):
+            code = super().error(line_number, offset, text, check)
+            if code and code.startswith('E'):
+                self.style_errors.append(CodeError(
+                    type='style',
+                    severity='warning',
+                    line=line_number,
+                    column=offset + 1,
+                    message=text,
+                    rule_id='flake8',
+                    suggestion='Follow PEP 8 style guidelines'
+                ))
+            return code
+
+
+class AstIssueVisitor(ast.NodeVisitor):
+    """Single AST pass that measures function complexity and finds unused variables"""
+    
+    BRANCH_NODES = (ast.If, ast.While, ast.For, ast.Try, ast.With)
+    COMPLEXITY_THRESHOLD = 10  # McCabe complexity threshold
+    
+    def __init__(self):
+        # Complexity: [node, complexity] per function in source order, plus the enclosing stack
+        self.function_frames = []
+        self.active_frames = []
+        
+        # Unused variables: bindings of the current function scope
+        self.defined_vars = set()
+        self.used_vars = set()
+        self.var_lines = {}
+        self.unused_issues = []
+    
+    def visit(self, node):
+        # A branch counts towards every enclosing function, like ast.walk over each of them
+        if isinstance(node, self.BRANCH_NODES):
+            for frame in self.active_frames:
+                frame[1] += 1
+        elif isinstance(node, ast.BoolOp):
+            for frame in self.active_frames:
+                frame[1] += len(node.values) - 1
+        return super().visit(node)
+    
+    def visit_Name(self, node):
+        if isinstance(node.ctx, ast.Store):
+            self.defined_vars.add(node.id)
+            self.var_lines[node.id] = node.lineno
+        elif isinstance(node.ctx, ast.Load):
+            self.used_vars.add(node.id)
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node):
+        frame = [node, 1]  # Base complexity
+        self.function_frames.append(frame)
+        self.active_frames.append(frame)
+        
+        # Save current state
+        old_defined = self.defined_vars.copy()
+        old_used = self.used_vars.copy()
+        old_lines = self.var_lines.copy()
+        
+        # Add function parameters
+        for arg in node.args.args:
+            self.defined_vars.add(arg.arg)
+            self.var_lines[arg.arg] = node.lineno
+        
+        self.generic_visit(node)
+        self.active_frames.pop()
+        
+        # Check for unused variables in this function
+        unused = self.defined_vars - self.used_vars
+        for var in unused:
+            if not var.startswith('_'):  # Ignore variables starting with _
+                self.unused_issues.append(CodeError(
+                    type='logic',
+                    severity='warning',
+                    line=self.var_lines.get(var, node.lineno),
+                    column=1,
+                    message=f"Unused variable '{var}'",
+                    rule_id='unused_variable',
+                    suggestion=f"Remove unused variable '{var}' or prefix with '_' if intentional"
+                ))
+        
+        # Restore state
+        self.defined_vars = old_defined
+        self.used_vars = old_used
+        self.var_lines = old_lines
+    
+    def complexity_issues(self) -> List[CodeError]:
+        """High-complexity warnings, in source order of the functions"""
+        issues = []
+        for node, complexity in self.function_frames:
+            if complexity > self.COMPLEXITY_THRESHOLD:
+                issues.append(CodeError(
+                    type='complexity',
+                    severity='warning',
+                    line=node.lineno,
+                    column=node.col_offset,
+                    message=f"Function '{node.name}' has high complexity ({complexity})",
+                    rule_id='high_complexity',
+                    suggestion='Consider breaking this function into smaller functions'
+                ))
+        return issues
+
+
+# pylint and astroid.MANAGER hold process-wide state, so runs are serialized across every ErrorDetector
+_PYLINT_LOCK = threading.Lock()
+
+
 class ErrorDetector:
     """Advanced error detection and correction using multiple static analysis tools and ML models"""
     
-    def __init__(self):
+    # Maximum number of style/pylint results kept in the content-addressed cache
+    LINT_CACHE_SIZE = 256
+    
+    # Maximum number of analyze_errors results kept, keyed by content hash and language
+    ANALYSIS_CACHE_SIZE = 256
+    
+    # Persistent analyze_errors results survive restarts and CI re-runs of unchanged files.
+    # The cache is opt-in (pass cache_dir); entries are salted with this module's mtime, so
+    # editing the detector invalidates them, and the version covers changes made elsewhere
+    DISK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'code_buddy', 'lint')
+    DISK_CACHE_VERSION = 1
+    # Fields a persisted entry must have to be served
+    DISK_RESULT_KEYS = frozenset({'error_summary', 'language', 'has_errors', 'has_issues', 'quality_score'})
+    DISK_SUMMARY_KEYS = frozenset({'total_errors', 'total_warnings', 'total_info', 'errors_by_type', 'errors_by_line'})
+    
+    # Generic suggestion attached to pattern issues of each category
+    CATEGORY_SUGGESTIONS = {
+        'security': 'Review security implications and use safer alternatives',
+        'performance': 'Consider optimizing for better performance',
+        'logic': 'Review logic and consider best practices',
+        'style': 'Follow language style guidelines'
+    }
+    
+    # Options for every ast.parse call: no type comments, grammar of the running interpreter
+    PARSE_OPTIONS = {'mode': 'exec', 'type_comments': False, 'feature_version': sys.version_info[:2]}
+    
+    def __init__(self, cache_dir: Optional[str] = None):
         self.common_patterns = {
             'python': {
                 'security': [
@@ -101,372 +257,574 @@ class ErrorDetector:
                 r'var\s+': r'let ',
             }
         }
+        
+        # Precompiled forms of the patterns above, built once per detector
+        self._pattern_rules = self._compile_patterns(self.common_patterns)
+        self._pattern_rule_ids = {
+            category: sys.intern(f'pattern_{category}')
+            for rules in self._pattern_rules.values()
+            for category, *_ in rules
+        }
+        self._compiled_auto_fixes = {
+            language: {
+                pattern: (re.compile(pattern), replacement)
+                for pattern, replacement in fixes.items()
+            }
+            for language, fixes in self.auto_fixes.items()
+        }
+    
+        
+        # Linter results keyed by content hash, in LRU order
+        self._lint_cache = OrderedDict()
+        self._lint_cache_lock = threading.Lock()
+        if PYCODESTYLE_AVAILABLE:
+            self._style_options = pycodestyle.StyleGuide(quiet=True).options
+        
+        # Full analyze_errors results keyed by (content hash, language), in LRU order
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+        
+        # On-disk results are salted with everything that can change them; None disables the cache
+        self.cache_dir = cache_dir
+        self._disk_cache_salt = repr((
+            self.DISK_CACHE_VERSION,
+            os.path.getmtime(__file__),
+            sys.version_info[:2],
+            pycodestyle.__version__ if PYCODESTYLE_AVAILABLE else None,
+            PYLINT_VERSION if PYLINT_AVAILABLE else None,
+            self.common_patterns
+        )).encode('utf-8')
+        
+        # Multi-pattern databases scan the whole buffer once per language
+        self._hyperscan_databases = {}
+        self._hyperscan_lock = threading.Lock()
+        if HYPERSCAN_AVAILABLE:
+            for language, rules in self._pattern_rules.items():
+                self._hyperscan_databases[language] = self._build_hyperscan_database(rules)
+        
+        # Per-language dispatch for analyze_errors: an optional parser and the checks to run, in report order
+        self._parsers = {'python': self._parse_python}
+        python_detectors = [self._pattern_rows, self._tree_rows]
+        if PYCODESTYLE_AVAILABLE or PYLINT_AVAILABLE:
+            python_detectors.append(self._lint_rows)
+        self._detectors = {
+            'python': python_detectors,
+            'javascript': [self._pattern_rows]
+        }
+    
+    def _line_local(self, pattern: str) -> str:
+        """Rewrite a pattern so it can never match across a newline"""
+        return pattern.replace('[^', r'[^\n').replace(r'\s', r'[^\S\n]')
+    
+    def reset_after_fork(self):
+        """Replace locks a forked child inherits, which may have been held by another parent thread"""
+        global _PYLINT_LOCK
+        _PYLINT_LOCK = threading.Lock()
+        self._lint_cache_lock = threading.Lock()
+        self._analysis_cache_lock = threading.Lock()
+        self._hyperscan_lock = threading.Lock()
+    
+    def _compile_patterns(self, common_patterns: Dict[str, Dict[str, list]]) -> Dict[str, List[tuple]]:
+        """Flatten pattern tables into (category, pattern, regex, message, auto_fix, confidence) rules"""
+        compiled = {}
+        for language, categories in common_patterns.items():
+            rules = []
+            for category, pattern_list in categories.items():
+                for item in pattern_list:
+                    if len(item) >= 4:  # New format with auto-fix and confidence
+                        pattern, message, auto_fix, confidence = item
+                    else:  # Old format for backward compatibility
+                        pattern, message = item[:2]
+                        auto_fix, confidence = None, 0.0
+                    regex = re.compile(self._line_local(pattern))
+                    rules.append((category, pattern, regex, message, auto_fix, confidence))
+            compiled[language] = rules
+        return compiled
+    
+    def _build_hyperscan_database(self, rules: List[tuple]):
+        """Compile all rules for a language into one Hyperscan database"""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[rule[2].pattern.encode('utf-8') for rule in rules],
+            ids=list(range(len(rules))),
+            elements=len(rules),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(rules)
+        )
+        return database
+    
+    def _scan_with_hyperscan(self, code: str, language: str) -> List[Dict[int, int]]:
+        """Find the first match column per line for every rule in a single buffer scan"""
+        rules = self._pattern_rules[language]
+        code_bytes = code.encode('utf-8')
+        line_starts = [0] + [m.end() for m in re.finditer(b'\n', code_bytes)]
+        found = [{} for _ in rules]
+        
+        def on_match(rule_id, start, end, flags, context):
+            line_num = bisect_right(line_starts, start)
+            column = len(code_bytes[line_starts[line_num - 1]:start].decode('utf-8')) + 1
+            current = found[rule_id].get(line_num)
+            if current is None or column < current:
+                found[rule_id][line_num] = column
+        
+        with self._hyperscan_lock:
+            self._hyperscan_databases[language].scan(code_bytes, match_event_handler=on_match)
+        return found
+    
+    def _scan_pattern_rules(self, code: str, language: str, line_starts: List[int]) -> List[Dict[int, int]]:
+        """Map each rule of a language to {line number: column of its first match on that line}"""
+        if language in self._hyperscan_databases:
+            return self._scan_with_hyperscan(code, language)
+        
+        # Each rule is scanned on its own: every pattern starts with a literal, which re
+        # searches for directly, while one combined alternation (especially with named
+        # groups to dispatch on) loses that fast path and is several times slower
+        rules = self._pattern_rules[language]
+        last_line = len(line_starts)
+        found = [{} for _ in rules]
+        for index, rule in enumerate(rules):
+            search = rule[2].search
+            matches = found[index]
+            line_num = 0
+            match = search(code)
+            # Patterns are line-local, so the first match starting on a line is its leftmost one;
+            # after recording it, resume at the next line instead of visiting the line's other matches
+            while match:
+                start = match.start()
+                line_num = bisect_right(line_starts, start, line_num)
+                matches[line_num] = start - line_starts[line_num - 1] + 1
+                if line_num == last_line:
+                    break
+                match = search(code, line_starts[line_num])
+        return found
+    
+    def _parse_python(self, code: str) -> Tuple[Optional[ast.Module], List[CodeError]]:
+        """Parse Python code once, returning the tree (or None) and any syntax errors"""
+        try:
+            return ast.parse(code, **self.PARSE_OPTIONS), []
+        except SyntaxError as e:
+            return None, [CodeError(
+                type='syntax',
+                severity='error',
+                line=e.lineno or 1,
+                column=e.offset or 1,
+                message=str(e.msg),
+                rule_id='syntax_error',
+                suggestion='Fix the syntax error according to Python grammar rules'
+            )]
+        except Exception as e:
+            return None, [CodeError(
+                type='syntax',
+                severity='error',
+                line=1,
+                column=1,
+                message=f"Parse error: {str(e)}",
+                rule_id='parse_error'
+            )]
     
     def detect_syntax_errors(self, code: str, language: str) -> List[CodeError]:
         """Detect syntax errors in code"""
-        errors = []
-        
-        if language == 'python':
+        if language != 'python':
+            return []
+        return self._parse_python(code)[1]
+    
+    def _content_digest(self, code: str) -> bytes:
+        """Hash source code for the content-addressed caches"""
+        return hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+    
+    def _disk_cache_path(self, code: str, language: str) -> str:
+        """Location of the on-disk analyze_errors result for this code, language and tool set"""
+        digest = hashlib.blake2b(
+            code.encode('utf-8') + b'|' + language.encode('utf-8') + b'|' + self._disk_cache_salt,
+            digest_size=16
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _load_disk_cache(self, path: str) -> Optional[Dict[str, Any]]:
+        """Read a persisted analysis result, or None if it is missing or unreadable"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            summary = result['error_summary']
+            if not (self.DISK_RESULT_KEYS <= result.keys() and self.DISK_SUMMARY_KEYS <= summary.keys()):
+                raise ValueError(f"incomplete cache entry {path}")
+            # JSON object keys are strings; line numbers are ints in a live result
+            summary['errors_by_line'] = {int(line): errors for line, errors in summary['errors_by_line'].items()}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Corrupt or foreign entries are removed; the fresh analysis then rewrites them
             try:
-                ast.parse(code)
-            except SyntaxError as e:
-                errors.append(CodeError(
-                    type='syntax',
-                    severity='error',
-                    line=e.lineno or 1,
-                    column=e.offset or 1,
-                    message=str(e.msg),
-                    rule_id='syntax_error',
-                    suggestion='Fix the syntax error according to Python grammar rules'
-                ))
-            except Exception as e:
-                errors.append(CodeError(
-                    type='syntax',
-                    severity='error',
-                    line=1,
-                    column=1,
-                    message=f"Parse error: {str(e)}",
-                    rule_id='parse_error'
-                ))
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return result
+    
+    def _store_disk_cache(self, path: str, result: Dict[str, Any]):
+        """Persist an analysis result atomically; the cache is best-effort, so write errors are ignored"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp',
+                                             encoding='utf-8', delete=False) as f:
+                json.dump(result, f)
+            os.replace(f.name, path)
+        except OSError:
+            pass
+    
+    def _run_linters(self, code: str) -> Tuple[List[CodeError], List[CodeError]]:
+        """Run the style checker and pylint on a single source; results are cached by content hash"""
+        return self._run_linters_many([code])[0]
+    
+    def _run_linters_many(self, codes: List[str]) -> List[Tuple[List[CodeError], List[CodeError]]]:
+        """Lint many sources in-process, with one pylint run for all of them, skipping cached ones"""
+        keys = [self._content_digest(code) for code in codes]
+        results = {}
+        with self._lint_cache_lock:
+            for key in keys:
+                if key in self._lint_cache:
+                    self._lint_cache.move_to_end(key)
+                    results[key] = self._lint_cache[key]
+        
+        # Unique uncached sources
+        pending = {}
+        for key, code in zip(keys, codes):
+            if key not in results:
+                pending.setdefault(key, code)
+        
+        if pending:
+            pylint_by_key = self._run_pylint(pending) if PYLINT_AVAILABLE else {}
+            for key, code in pending.items():
+                style_errors = self._check_style(code) if PYCODESTYLE_AVAILABLE else []
+                results[key] = (style_errors, pylint_by_key.get(key, []))
+            
+            with self._lint_cache_lock:
+                for key in pending:
+                    self._lint_cache[key] = results[key]
+                while len(self._lint_cache) > self.LINT_CACHE_SIZE:
+                    self._lint_cache.popitem(last=False)
         
+        return [results[key] for key in keys]
+    
+    def _check_style(self, code: str) -> List[CodeError]:
+        """Run pycodestyle (flake8's E-code checker) on the code in memory"""
+        report = _StyleReport(self._style_options)
+        checker = pycodestyle.Checker(
+            lines=code.splitlines(True), options=self._style_options, report=report
+        )
+        checker.check_all()
+        # Report in position order, as flake8 does
+        return sorted(report.style_errors, key=lambda error: (error.line, error.column))
+    
+    def _run_pylint(self, sources: Dict[bytes, str]) -> Dict[bytes, List[CodeError]]:
+        """Run pylint in-process once over all sources, returning its errors per content key"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            names = {}
+            for index, (key, code) in enumerate(sources.items()):
+                name = f"s{index}.py"
+                with open(os.path.join(temp_dir, name), 'w', encoding='utf-8') as f:
+                    f.write(code)
+                names[name] = key
+            
+            # An empty rcfile keeps results independent of the server's working directory
+            rcfile = os.path.join(temp_dir, 'pylintrc')
+            open(rcfile, 'w').close()
+            
+            output = io.StringIO()
+            # Only one run may be in flight per process, whichever detector started it
+            with _PYLINT_LOCK:
+                try:
+                    PylintRun(
+                        [f'--rcfile={rcfile}', '--disable=import-error,missing-module-docstring',
+                         '--reports=no', '--score=no',
+                         *(os.path.join(temp_dir, name) for name in names)],
+                        reporter=JSONReporter(output),
+                        exit=False
+                    )
+                finally:
+                    # Drop the temporary modules from astroid's cache so it does not grow per call
+                    for name in names:
+                        astroid.MANAGER.astroid_cache.pop(name[:-3], None)
+        
+        pylint_by_file = self._parse_pylint_output(output.getvalue())
+        return {key: pylint_by_file.get(name, []) for name, key in names.items()}
+    
+    def _parse_pylint_output(self, output: str) -> Dict[str, List[CodeError]]:
+        """Parse pylint JSON output into logic errors grouped by file name, keeping errors and warnings only"""
+        errors = {}
+        try:
+            messages = json.loads(output) if output.strip() else []
+        except ValueError:
+            return errors
+        
+        for item in messages:
+            if item.get('type') in ('error', 'fatal'):
+                severity = 'error'
+            elif item.get('type') == 'warning':
+                severity = 'warning'
+            else:
+                continue
+            
+            errors.setdefault(os.path.basename(item.get('path', '')), []).append(CodeError(
+                type='logic',
+                severity=severity,
+                line=item.get('line') or 1,
+                column=1,
+                message=f"{item.get('message-id', '')}: {item.get('message', '')} ({item.get('symbol', '')})",
+                rule_id='pylint',
+                suggestion='Review code logic and structure'
+            ))
         return errors
     
     def detect_style_issues(self, code: str, language: str) -> List[CodeError]:
-        """Detect style and formatting issues using flake8"""
-        errors = []
-        
+        """Detect style and formatting issues using pycodestyle"""
         if language != 'python':
-            return errors
+            return []
         
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-            
-            # Run flake8
-            style_guide = flake8.get_style_guide()
-            report = style_guide.check_files([temp_file])
-            
-            # Parse flake8 output
-            for error in report.get_statistics('E'):
-                parts = error.split(':')
-                if len(parts) >= 4:
-                    line_num = int(parts[1])
-                    col_num = int(parts[2])
-                    message = ':'.join(parts[3:]).strip()
-                    
-                    errors.append(CodeError(
-                        type='style',
-                        severity='warning',
-                        line=line_num,
-                        column=col_num,
-                        message=message,
-                        rule_id='flake8',
-                        suggestion='Follow PEP 8 style guidelines'
-                    ))
-            
-            # Clean up
-            os.unlink(temp_file)
-            
+            return self._run_linters(code)[0]
         except Exception as e:
             print(f"Style check failed: {e}")
-        
-        return errors
+            return []
     
     def detect_pylint_issues(self, code: str, language: str) -> List[CodeError]:
         """Detect issues using pylint"""
-        errors = []
-        
         if language != 'python':
-            return errors
+            return []
         
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_file = f.name
-            
-            # Capture pylint output
-            from io import StringIO
-            output = StringIO()
-            
-            # Run pylint with minimal configuration
-            pylint_opts = [
-                '--disable=import-error,missing-module-docstring',
-                '--reports=no',
-                '--score=no',
-                temp_file
-            ]
-            
-            try:
-                pylint.lint.Run(pylint_opts, reporter=pylint.reporters.text.TextReporter(output), exit=False)
-                
-                # Parse pylint output
-                for line in output.getvalue().split('\n'):
-                    if ':' in line and ('error' in line or 'warning' in line):
-                        try:
-                            parts = line.split(':')
-                            if len(parts) >= 3:
-                                line_num = int(parts[1])
-                                severity = 'error' if 'error' in line else 'warning'
-                                message = ':'.join(parts[2:]).strip()
-                                
-                                errors.append(CodeError(
-                                    type='logic',
-                                    severity=severity,
-                                    line=line_num,
-                                    column=1,
-                                    message=message,
-                                    rule_id='pylint',
-                                    suggestion='Review code logic and structure'
-                                ))
-                        except (ValueError, IndexError):
-                            continue
-            except SystemExit:
-                pass  # Pylint calls sys.exit, ignore it
-            
-            # Clean up
-            os.unlink(temp_file)
-            
+            return self._run_linters(code)[1]
         except Exception as e:
             print(f"Pylint check failed: {e}")
-        
-        return errors
+            return []
     
     def detect_pattern_issues(self, code: str, language: str) -> List[CodeError]:
         """Detect common anti-patterns and issues using regex patterns"""
-        errors = []
-        
-        if language not in self.common_patterns:
-            return errors
-        
-        patterns = self.common_patterns[language]
-        lines = code.split('\n')
-        
-        for category, pattern_list in patterns.items():
-            for item in pattern_list:
-                if len(item) >= 4:  # New format with auto-fix and confidence
-                    pattern, message, auto_fix, confidence = item
-                else:  # Old format for backward compatibility
-                    pattern, message = item[:2]
-                    auto_fix, confidence = None, 0.0
-                
-                for line_num, line in enumerate(lines, 1):
-                    match = re.search(pattern, line)
-                    if match:
-                        severity = 'error' if category == 'security' else 'warning'
-                        
-                        # Generate automatic fix if available
+        return [CodeError(*row) for row in self._pattern_issue_rows(code, language)]
+    
+    def _pattern_issue_rows(self, code: str, language: str, summary_only: bool = False):
+        """Yield pattern issues as tuples in CodeError field order"""
+        if language not in self._pattern_rules:
+            return
+        
+        auto_fixes = self._compiled_auto_fixes.get(language, {})
+        # Offsets where each line begins, so lines are sliced only when a fix needs them
+        line_starts = [0] + [m.end() for m in re.finditer('\n', code)]
+        found = self._scan_pattern_rules(code, language, line_starts)
+        
+        for rule, matches in zip(self._pattern_rules[language], found):
+            category, pattern, _, message, auto_fix, confidence = rule
+            severity = 'error' if category == 'security' else 'warning'
+            # Shared by every match of this rule, so each error references the same strings
+            rule_id = self._pattern_rule_ids[category]
+            suggestion = self._get_suggestion(category, pattern)
+            
+            # The summary needs neither the fix nor the confidence, so skip generating them
+            if summary_only:
+                for line_num in sorted(matches):
+                    yield (category, severity, line_num, matches[line_num], message, rule_id, suggestion)
+                continue
+            
+            # A rule's own auto-fix text takes precedence over a generated one
+            fix_regex, fix_replacement = (None, None) if auto_fix else auto_fixes.get(pattern, (None, None))
+            for line_num in sorted(matches):
+                # Generate automatic fix if available
+                generated_fix = None
+                if fix_regex is not None:
+                    line_end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(code)
+                    try:
+                        generated_fix = fix_regex.sub(fix_replacement, code[line_starts[line_num - 1]:line_end])
+                    except:
                         generated_fix = None
-                        if language in self.auto_fixes and pattern in self.auto_fixes[language]:
-                            try:
-                                generated_fix = re.sub(pattern, self.auto_fixes[language][pattern], line)
-                            except:
-                                generated_fix = None
-                        
-                        errors.append(CodeError(
-                            type=category,
-                            severity=severity,
-                            line=line_num,
-                            column=match.start() + 1,
-                            message=message,
-                            rule_id=f'pattern_{category}',
-                            suggestion=self._get_suggestion(category, pattern),
-                            auto_fix=auto_fix or generated_fix,
-                            confidence=confidence
-                        ))
-        
-        return errors
+                
+                yield (category, severity, line_num, matches[line_num], message, rule_id, suggestion,
+                       auto_fix or generated_fix, confidence)
     
-    def detect_complexity_issues(self, code: str, language: str) -> List[CodeError]:
+    def _analyze_tree(self, tree: ast.Module) -> Tuple[List[CodeError], List[CodeError]]:
+        """Collect complexity and unused-variable issues from one pass over a parsed tree"""
+        visitor = AstIssueVisitor()
+        visitor.visit(tree)
+        return visitor.complexity_issues(), visitor.unused_issues
+    
+    def detect_complexity_issues(self, code: str, language: str, tree: ast.Module = None) -> List[CodeError]:
         """Detect complexity-related issues"""
-        errors = []
-        
         if language != 'python':
-            return errors
+            return []
         
         try:
-            tree = ast.parse(code)
-            
-            class ComplexityVisitor(ast.NodeVisitor):
-                def __init__(self):
-                    self.complexity_issues = []
-                
-                def visit_FunctionDef(self, node):
-                    # Count complexity indicators
-                    complexity = 1  # Base complexity
-                    
-                    for child in ast.walk(node):
-                        if isinstance(child, (ast.If, ast.While, ast.For, ast.Try, ast.With)):
-                            complexity += 1
-                        elif isinstance(child, ast.BoolOp):
-                            complexity += len(child.values) - 1
-                    
-                    if complexity > 10:  # McCabe complexity threshold
-                        self.complexity_issues.append(CodeError(
-                            type='complexity',
-                            severity='warning',
-                            line=node.lineno,
-                            column=node.col_offset,
-                            message=f"Function '{node.name}' has high complexity ({complexity})",
-                            rule_id='high_complexity',
-                            suggestion='Consider breaking this function into smaller functions'
-                        ))
-                    
-                    self.generic_visit(node)
-            
-            visitor = ComplexityVisitor()
-            visitor.visit(tree)
-            errors.extend(visitor.complexity_issues)
-            
+            if tree is None:
+                tree = ast.parse(code, **self.PARSE_OPTIONS)
+            return self._analyze_tree(tree)[0]
         except Exception as e:
             print(f"Complexity analysis failed: {e}")
-        
-        return errors
+            return []
     
-    def detect_unused_variables(self, code: str, language: str) -> List[CodeError]:
+    def detect_unused_variables(self, code: str, language: str, tree: ast.Module = None) -> List[CodeError]:
         """Detect unused variables"""
-        errors = []
-        
         if language != 'python':
-            return errors
+            return []
         
         try:
-            tree = ast.parse(code)
-            
-            class UnusedVariableVisitor(ast.NodeVisitor):
-                def __init__(self):
-                    self.defined_vars = set()
-                    self.used_vars = set()
-                    self.var_lines = {}
-                    self.unused_issues = []
-                
-                def visit_Name(self, node):
-                    if isinstance(node.ctx, ast.Store):
-                        self.defined_vars.add(node.id)
-                        self.var_lines[node.id] = node.lineno
-                    elif isinstance(node.ctx, ast.Load):
-                        self.used_vars.add(node.id)
-                    self.generic_visit(node)
-                
-                def visit_FunctionDef(self, node):
-                    # Save current state
-                    old_defined = self.defined_vars.copy()
-                    old_used = self.used_vars.copy()
-                    old_lines = self.var_lines.copy()
-                    
-                    # Add function parameters
-                    for arg in node.args.args:
-                        self.defined_vars.add(arg.arg)
-                        self.var_lines[arg.arg] = node.lineno
-                    
-                    self.generic_visit(node)
-                    
-                    # Check for unused variables in this function
-                    unused = self.defined_vars - self.used_vars
-                    for var in unused:
-                        if not var.startswith('_'):  # Ignore variables starting with _
-                            self.unused_issues.append(CodeError(
-                                type='logic',
-                                severity='warning',
-                                line=self.var_lines.get(var, node.lineno),
-                                column=1,
-                                message=f"Unused variable '{var}'",
-                                rule_id='unused_variable',
-                                suggestion=f"Remove unused variable '{var}' or prefix with '_' if intentional"
-                            ))
-                    
-                    # Restore state
-                    self.defined_vars = old_defined
-                    self.used_vars = old_used
-                    self.var_lines = old_lines
-            
-            visitor = UnusedVariableVisitor()
-            visitor.visit(tree)
-            errors.extend(visitor.unused_issues)
-            
+            if tree is None:
+                tree = ast.parse(code, **self.PARSE_OPTIONS)
+            return self._analyze_tree(tree)[1]
         except Exception as e:
             print(f"Unused variable analysis failed: {e}")
-        
-        return errors
+            return []
     
     def _get_suggestion(self, category: str, pattern: str) -> str:
         """Get suggestion based on error category and pattern"""
-        suggestions = {
-            'security': 'Review security implications and use safer alternatives',
-            'performance': 'Consider optimizing for better performance',
-            'logic': 'Review logic and consider best practices',
-            'style': 'Follow language style guidelines'
-        }
-        return suggestions.get(category, 'Review and fix this issue')
+        return self.CATEGORY_SUGGESTIONS.get(category, 'Review and fix this issue')
+    
+    def _summary_row(self, error: CodeError) -> tuple:
+        """Reduce a CodeError to the fields reported in the analysis summary"""
+        return (error.type, error.severity, error.line, error.column,
+                error.message, error.rule_id, error.suggestion)
+    
+    def _copy_result(self, result: Dict[str, Any], filename: str) -> Dict[str, Any]:
+        """Copy a cached result for a caller, down to its issue lists, with the filename patched in"""
+        return {**result, 'filename': filename, 'error_summary': copy.deepcopy(result['error_summary'])}
     
     def analyze_errors(self, code: str, language: str, filename: str = None) -> Dict[str, Any]:
         """Comprehensive error analysis"""
-        all_errors = []
-        
-        # Run all error detection methods
-        all_errors.extend(self.detect_syntax_errors(code, language))
-        all_errors.extend(self.detect_pattern_issues(code, language))
-        all_errors.extend(self.detect_complexity_issues(code, language))
-        all_errors.extend(self.detect_unused_variables(code, language))
-        
-        # Only run external tools for Python if available
-        if language == 'python':
-            if FLAKE8_AVAILABLE:
-                try:
-                    all_errors.extend(self.detect_style_issues(code, language))
-                except Exception as e:
-                    print(f"Style analysis skipped: {e}")
+        # Repeat analyses of unchanged code (e.g. analyze-on-save) are served from the cache
+        cache_key = (self._content_digest(code), language)
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+        if cached is not None:
+            return self._copy_result(cached, filename)
+        
+        disk_path = self._disk_cache_path(code, language) if self.cache_dir else None
+        if disk_path:
+            cached = self._load_disk_cache(disk_path)
+            if cached is not None:
+                self._store_cached_errors(cache_key, cached)
+                return self._copy_result(cached, filename)
+        
+        # Summary rows (type, severity, line, column, message, rule_id, suggestion) in report order
+        rows = []
+        # Results missing a check because it failed are not cached
+        cacheable = True
+        
+        # Languages with a parser are parsed once; the tree feeds the AST-based checks
+        tree = None
+        parser = self._parsers.get(language)
+        if parser is not None:
+            tree, syntax_errors = parser(code)
+            rows.extend(map(self._summary_row, syntax_errors))
+        
+        # Run the checks registered for this language; they stay sequential because the regex
+        # engine, the AST visitor and the in-process linters all hold the GIL, so threads would not overlap
+        for detector in self._detectors.get(language, ()):
+            detector_rows = detector(code, language, tree)
+            if detector_rows is None:
+                cacheable = False
+            else:
+                rows.extend(detector_rows)
+        
+        # Count severities and group errors by type and line in a single pass
+        severity_counts = Counter()
+        errors_by_type = defaultdict(list)
+        errors_by_line = defaultdict(list)
+        
+        for error_type, severity, line, column, message, rule_id, suggestion in rows:
+            severity_counts[severity] += 1
             
-            if PYLINT_AVAILABLE:
-                try:
-                    all_errors.extend(self.detect_pylint_issues(code, language))
-                except Exception as e:
-                    print(f"Pylint analysis skipped: {e}")
-        
-        # Group errors by type and severity
-        error_summary = {
-            'total_errors': len([e for e in all_errors if e.severity == 'error']),
-            'total_warnings': len([e for e in all_errors if e.severity == 'warning']),
-            'total_info': len([e for e in all_errors if e.severity == 'info']),
-            'errors_by_type': {},
-            'errors_by_line': {}
-        }
-        
-        for error in all_errors:
             # Group by type
-            if error.type not in error_summary['errors_by_type']:
-                error_summary['errors_by_type'][error.type] = []
-            error_summary['errors_by_type'][error.type].append({
-                'severity': error.severity,
-                'line': error.line,
-                'column': error.column,
-                'message': error.message,
-                'rule_id': error.rule_id,
-                'suggestion': error.suggestion
+            errors_by_type[error_type].append({
+                'severity': severity,
+                'line': line,
+                'column': column,
+                'message': message,
+                'rule_id': rule_id,
+                'suggestion': suggestion
             })
             
             # Group by line
-            if error.line not in error_summary['errors_by_line']:
-                error_summary['errors_by_line'][error.line] = []
-            error_summary['errors_by_line'][error.line].append({
-                'type': error.type,
-                'severity': error.severity,
-                'column': error.column,
-                'message': error.message,
-                'rule_id': error.rule_id,
-                'suggestion': error.suggestion
+            errors_by_line[line].append({
+                'type': error_type,
+                'severity': severity,
+                'column': column,
+                'message': message,
+                'rule_id': rule_id,
+                'suggestion': suggestion
             })
         
-        return {
+        error_summary = {
+            'total_errors': severity_counts['error'],
+            'total_warnings': severity_counts['warning'],
+            'total_info': severity_counts['info'],
+            'errors_by_type': dict(errors_by_type),
+            'errors_by_line': dict(errors_by_line)
+        }
+        
+        result = {
             'filename': filename,
             'language': language,
             'error_summary': error_summary,
             'has_errors': error_summary['total_errors'] > 0,
-            'has_issues': len(all_errors) > 0,
-            'quality_score': self._calculate_quality_score(error_summary, len(code.split('\n')))
+            'has_issues': len(rows) > 0,
+            'quality_score': self._calculate_quality_score(error_summary, code.count('\n') + 1)
         }
+        
+        if cacheable:
+            self._store_cached_errors(cache_key, result)
+            if disk_path:
+                self._store_disk_cache(disk_path, {**result, 'filename': None})
+        
+        return self._copy_result(result, filename)
+    
+    def _pattern_rows(self, code: str, language: str, tree: Optional[ast.Module]) -> List[tuple]:
+        """Summary rows for pattern issues, usually the most numerous, without building CodeErrors"""
+        return list(self._pattern_issue_rows(code, language, summary_only=True))
+    
+    def _tree_rows(self, code: str, language: str, tree: Optional[ast.Module]) -> Optional[List[tuple]]:
+        """Summary rows for complexity and unused-variable issues, or None if the pass failed"""
+        if tree is None:
+            return []
+        try:
+            complexity_issues, unused_issues = self._analyze_tree(tree)
+        except Exception as e:
+            print(f"AST analysis failed: {e}")
+            return None
+        return [self._summary_row(error) for error in complexity_issues + unused_issues]
+    
+    def _lint_rows(self, code: str, language: str, tree: Optional[ast.Module]) -> Optional[List[tuple]]:
+        """Summary rows for style and pylint issues from one shared linter pass, or None if it failed"""
+        try:
+            style_errors, pylint_errors = self._run_linters(code)
+        except Exception as e:
+            print(f"Lint analysis skipped: {e}")
+            return None
+        return [self._summary_row(error) for error in style_errors + pylint_errors]
+    
+    def _store_cached_errors(self, key: tuple, result: Dict[str, Any]):
+        """Store an analyze_errors result in memory, evicting the least recently used entry if full"""
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
+    def analyze_errors_many(self, sources: List[Tuple[str, str]],
+                            filenames: List[str] = None) -> List[Dict[str, Any]]:
+        """Analyze many (code, language) pairs, linting all Python sources in one batch"""
+        if filenames is None:
+            filenames = [None] * len(sources)
+        
+        # Warm the lint cache with a single pylint run over every Python source
+        python_sources = [code for code, language in sources if language == 'python']
+        if python_sources and (PYCODESTYLE_AVAILABLE or PYLINT_AVAILABLE):
+            try:
+                self._run_linters_many(python_sources)
+            except Exception as e:
+                print(f"Batch lint analysis skipped: {e}")
+        
+        return [
+            self.analyze_errors(code, language, filename)
+            for (code, language), filename in zip(sources, filenames)
+        ]
     
     def _calculate_quality_score(self, error_summary: Dict, line_count: int) -> float:
         """Calculate a code quality score (0-100)"""
@@ -489,9 +847,8 @@ class ErrorDetector:
     def auto_fix_code(self, code: str, language: str, errors: List[CodeError] = None) -> Dict[str, Any]:
         """Automatically fix common code issues"""
         if errors is None:
-            # Analyze code to find errors first
-            analysis = self.analyze_errors(code, language)
-            errors = self._extract_errors_from_analysis(analysis)
+            # Only pattern issues carry auto-fix text and confidence, so they are all that is needed
+            errors = self.detect_pattern_issues(code, language)
         
         fixed_code = code
         fixes_applied = []
@@ -502,6 +859,7 @@ class ErrorDetector:
         fixable_errors.sort(key=lambda x: x.line, reverse=True)
         
         lines = fixed_code.split('\n')
+        fix_rules = self._compiled_auto_fixes.get(language)
         
         for error in fixable_errors:
             try:
@@ -509,22 +867,22 @@ class ErrorDetector:
                     line_idx = error.line - 1
                     original_line = lines[line_idx]
                     
-                    # Apply regex-based fixes
-                    if language in self.auto_fixes:
-                        for pattern, replacement in self.auto_fixes[language].items():
-                            if re.search(pattern, original_line):
-                                fixed_line = re.sub(pattern, replacement, original_line)
-                                if fixed_line != original_line:
-                                    lines[line_idx] = fixed_line
-                                    fixes_applied.append({
-                                        'line': error.line,
-                                        'original': original_line.strip(),
-                                        'fixed': fixed_line.strip(),
-                                        'rule_id': error.rule_id,
-                                        'confidence': error.confidence,
-                                        'message': error.message
-                                    })
-                                    break
+                    # Apply regex-based fixes; a non-matching sub returns the line unchanged,
+                    # so no separate search is needed
+                    if fix_rules is not None:
+                        for regex, replacement in fix_rules.values():
+                            fixed_line = regex.sub(replacement, original_line)
+                            if fixed_line != original_line:
+                                lines[line_idx] = fixed_line
+                                fixes_applied.append({
+                                    'line': error.line,
+                                    'original': original_line.strip(),
+                                    'fixed': fixed_line.strip(),
+                                    'rule_id': error.rule_id,
+                                    'confidence': error.confidence,
+                                    'message': error.message
+                                })
+                                break
                     
                     # Apply specific auto-fixes from error detection
                     elif hasattr(error, 'auto_fix') and error.auto_fix:
@@ -558,11 +916,10 @@ class ErrorDetector:
             # Check for common Python improvements
             lines = code.split('\n')
             
+            # Substring checks run on the raw line; only 'def ' lines are stripped
             for i, line in enumerate(lines, 1):
-                line_stripped = line.strip()
-                
                 # Suggest f-strings instead of format()
-                if '.format(' in line_stripped:
+                if '.format(' in line:
                     suggestions.append({
                         'line': i,
                         'type': 'modernization',
@@ -572,7 +929,7 @@ class ErrorDetector:
                     })
                 
                 # Suggest pathlib instead of os.path
-                if 'os.path.' in line_stripped:
+                if 'os.path.' in line:
                     suggestions.append({
                         'line': i,
                         'type': 'modernization',
@@ -582,7 +939,7 @@ class ErrorDetector:
                     })
                 
                 # Suggest type hints
-                if line_stripped.startswith('def ') and '->' not in line_stripped:
+                if 'def ' in line and '->' not in line and line.strip().startswith('def '):
                     suggestions.append({
                         'line': i,
                         'type': 'typing',
@@ -595,6 +952,8 @@ class ErrorDetector:
             lines = code.split('\n')
             
             for i, line in enumerate(lines, 1):
+                if 'function(' not in line and 'var ' not in line:
+                    continue
                 line_stripped = line.strip()
                 
                 # Suggest arrow functions
@@ -623,25 +982,6 @@ class ErrorDetector:
             'total_suggestions': len(suggestions)
         }
     
-    def _extract_errors_from_analysis(self, analysis: Dict[str, Any]) -> List[CodeError]:
-        """Extract CodeError objects from analysis results"""
-        errors = []
-        
-        if 'error_summary' in analysis:
-            for error_type, error_list in analysis['error_summary'].get('errors_by_type', {}).items():
-                for error_data in error_list:
-                    errors.append(CodeError(
-                        type=error_type,
-                        severity=error_data.get('severity', 'warning'),
-                        line=error_data.get('line', 1),
-                        column=error_data.get('column', 1),
-                        message=error_data.get('message', ''),
-                        rule_id=error_data.get('rule_id'),
-                        suggestion=error_data.get('suggestion')
-                    ))
-        
-        return errors
-    
     def comprehensive_analysis(self, code: str, language: str, filename: str = None, auto_fix: bool = False) -> Dict[str, Any]:
         """Perform comprehensive code analysis with optional auto-fixing"""
         # Basic error analysis
@@ -658,10 +998,9 @@ class ErrorDetector:
             'auto_fix_available': False
         }
         
-        # Auto-fix if requested
+        # Auto-fix if requested; the summary dicts drop auto-fix data, so fixes come from the pattern issues
         if auto_fix:
-            errors = self._extract_errors_from_analysis(error_analysis)
-            fix_results = self.auto_fix_code(code, language, errors)
+            fix_results = self.auto_fix_code(code, language)
             result['auto_fix'] = fix_results
             result['auto_fix_available'] = len(fix_results['fixes_applied']) > 0
         
@@ -8,27 +8,24 @@ import os
 sys.path.append('.')
 
 from core.analyzer import CodeAnalyzer
-from core.error_detector import ErrorDetector
 import json
 
-def print_section(title):
-    """Print a formatted section header"""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}")
+# Analyzer shared by every demo, created on first use
+_ANALYZER = None
 
-def print_subsection(title):
-    """Print a formatted subsection header"""
-    print(f"\n{'-'*40}")
-    print(f"  {title}")
-    print(f"{'-'*40}")
+def _get_analyzer():
+    """Return the shared CodeAnalyzer, creating it on first use"""
+    global _ANALYZER
+    if _ANALYZER is None:
+        _ANALYZER = CodeAnalyzer()
+    return _ANALYZER
 
-def demo_error_detection():
-    """Demonstrate error detection capabilities"""
-    print_section("ERROR DETECTION DEMO")
-    
-    # Sample code with various issues
-    sample_code = '''
+def _get_detector():
+    """Return the shared analyzer's ErrorDetector"""
+    return _get_analyzer().error_detector
+
+# Sample code with various issues
+_SAMPLE_CODE = '''
 import os
 import sys
 
@@ -71,11 +68,89 @@ def complex_function(a, b, c, d, e):
                                         print("Complex nested logic")
     return True
 '''
+
+# Sample code with fixable issues
+_FIXABLE_CODE = '''
+def example_function(data):
+    # These issues can be automatically fixed
+    if len(data) == 0:
+        return False
+    
+    if len(data) > 0:
+        print("Data available")
+    
+    if result == True:
+        return "success"
+    
+    if status != False:
+        process_data()
+    
+    return True
+'''
+
+# Sample JavaScript code with issues
+_JS_CODE = '''
+function processData(data) {
+    var result = null;
+    var status = "pending";
+    
+    if (data == null) {
+        return false;
+    }
+    
+    if (status == "ready") {
+        console.log("Processing data");
+        result = data.map(function(item) {
+            return item * 2;
+        });
+    }
+    
+    if (result != null) {
+        alert("Processing complete!");
+        return result;
+    }
+    
+    return false;
+}
+'''
+
+# Sample code with security risks
+_SECURITY_CODE = '''
+import pickle
+import subprocess
+
+def unsafe_operations(user_input):
+    # Security risks
+    data = eval(user_input)
+    result = exec(user_input)
+    file_data = pickle.loads(user_input)
     
-    analyzer = CodeAnalyzer()
+    # Command injection risk
+    subprocess.call(f"ls {user_input}", shell=True)
+    
+    return data
+'''
+
+def print_section(title):
+    """Print a formatted section header"""
+    print(f"\n{'='*60}")
+    print(f"  {title}")
+    print(f"{'='*60}")
+
+def print_subsection(title):
+    """Print a formatted subsection header"""
+    print(f"\n{'-'*40}")
+    print(f"  {title}")
+    print(f"{'-'*40}")
+
+def demo_error_detection():
+    """Demonstrate error detection capabilities"""
+    print_section("ERROR DETECTION DEMO")
+    
+    analyzer = _get_analyzer()
     
     print("Analyzing code with multiple issues...")
-    analysis = analyzer.comprehensive_analysis(sample_code, "demo.py", auto_fix=False)
+    analysis = analyzer.comprehensive_analysis(_SAMPLE_CODE, "demo.py", auto_fix=False)
     
     if 'error' in analysis:
         print(f"Analysis failed: {analysis['error']}")
@@ -117,34 +192,15 @@ def demo_auto_fix():
     """Demonstrate automatic error correction"""
     print_section("AUTO-FIX DEMO")
     
-    # Sample code with fixable issues
-    fixable_code = '''
-def example_function(data):
-    # These issues can be automatically fixed
-    if len(data) == 0:
-        return False
-    
-    if len(data) > 0:
-        print("Data available")
-    
-    if result == True:
-        return "success"
-    
-    if status != False:
-        process_data()
-    
-    return True
-'''
-    
-    analyzer = CodeAnalyzer()
+    analyzer = _get_analyzer()
     
     print("Original code:")
-    print(fixable_code)
+    print(_FIXABLE_CODE)
     
     print_subsection("Auto-fixing Issues")
     
     # Perform auto-fix
-    fix_result = analyzer.fix_code_issues(fixable_code, "fixable.py")
+    fix_result = analyzer.fix_code_issues(_FIXABLE_CODE, "fixable.py")
     
     if 'error' in fix_result:
         print(f"Auto-fix failed: {fix_result['error']}")
@@ -171,36 +227,10 @@ def demo_comprehensive_analysis():
     """Demonstrate comprehensive analysis with auto-fix"""
     print_section("COMPREHENSIVE ANALYSIS WITH AUTO-FIX")
     
-    # Sample JavaScript code with issues
-    js_code = '''
-function processData(data) {
-    var result = null;
-    var status = "pending";
-    
-    if (data == null) {
-        return false;
-    }
-    
-    if (status == "ready") {
-        console.log("Processing data");
-        result = data.map(function(item) {
-            return item * 2;
-        });
-    }
-    
-    if (result != null) {
-        alert("Processing complete!");
-        return result;
-    }
-    
-    return false;
-}
-'''
-    
-    analyzer = CodeAnalyzer()
+    analyzer = _get_analyzer()
     
     print("Analyzing JavaScript code with auto-fix enabled...")
-    analysis = analyzer.comprehensive_analysis(js_code, "demo.js", auto_fix=True)
+    analysis = analyzer.comprehensive_analysis(_JS_CODE, "demo.js", auto_fix=True)
     
     if 'error' in analysis:
         print(f"Analysis failed: {analysis['error']}")
@@ -230,26 +260,10 @@ def demo_pattern_detection():
     """Demonstrate advanced pattern detection"""
     print_section("ADVANCED PATTERN DETECTION")
     
-    security_code = '''
-import pickle
-import subprocess
-
-def unsafe_operations(user_input):
-    # Security risks
-    data = eval(user_input)
-    result = exec(user_input)
-    file_data = pickle.loads(user_input)
-    
-    # Command injection risk
-    subprocess.call(f"ls {user_input}", shell=True)
-    
-    return data
-'''
-    
-    detector = ErrorDetector()
+    detector = _get_detector()
     
     print("Analyzing code for security vulnerabilities...")
-    analysis = detector.analyze_errors(security_code, 'python', 'security_demo.py')
+    analysis = detector.analyze_errors(_SECURITY_CODE, 'python', 'security_demo.py')
     
     print_subsection("Security Issues Detected")
     security_errors = analysis['error_summary']['errors_by_type'].get('security', [])
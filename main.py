@@ -21,11 +21,20 @@ Version: 1.0.0
 import os
 import sys
 import argparse
+import hashlib
 import json
+import mmap
+import multiprocessing
+import multiprocessing.util
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import time
 
+import torch
+
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -33,15 +42,93 @@ from core.analyzer import CodeAnalyzer
 from core.error_detector import ErrorDetector
 from core.documentation import DocumentationGenerator
 
+# Import tqdm for the directory progress bar; without it, progress is simply not shown
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Import orjson with fallback to the standard library encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def dump_json(data: Any):
+    """Serialize data as indented JSON, using orjson's C encoder when available"""
+    if ORJSON_AVAILABLE:
+        # Line numbers key some result dicts, so allow non-string keys as json.dump does
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=str)
+
+def dump_json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON line for a JSONL stream"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, default=str) + '\n').encode('utf-8')
+
+def atomic_write(path: str, content):
+    """Write text or bytes beside path, then move it into place so readers never see a partial file"""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if isinstance(content, bytes):
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def write_json(path: str, data: Any):
+    """Write data to path as indented JSON"""
+    atomic_write(path, dump_json(data))
+
 class CodeAnalysisPipeline:
     """Unified pipeline for comprehensive code analysis"""
     
-    def __init__(self):
+    # Per-file analysis results are reused across runs while the file and the analyzers are unchanged
+    CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'code_buddy', 'analysis')
+    
+    # Virtual environments and other common directories skipped during discovery
+    EXCLUDED_DIRS = frozenset(['venv', '.venv', 'env', '.env', 'node_modules', '.git', '__pycache__'])
+    
+    # Threads that flush output files while the next file is analyzed
+    IO_WORKERS = 4
+    
+    # Files larger than this are memory-mapped instead of read into a bytes copy
+    MMAP_THRESHOLD = 64 * 1024
+    
+    def __init__(self, use_cache: bool = True, verbose: bool = False):
         """Initialize the analysis pipeline"""
         print("🚀 Initializing Code Analysis Pipeline...")
         self.analyzer = CodeAnalyzer()
         self.error_detector = ErrorDetector()
         self.doc_generator = DocumentationGenerator()
+        self.use_cache = use_cache
+        self.verbose = verbose
+        # Per-file output is always shown for single files, and for directories only when verbose
+        self._show_file_details = True
+        self._run_timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        self._languages_by_extension = {}
+        self._io_pool = None
+        self._pending_writes = []
+        if use_cache:
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+            # The detector's on-disk lint cache is opt-in; the CLI always wants it unless --no-cache
+            self.analyzer.error_detector.cache_dir = ErrorDetector.DISK_CACHE_DIR
+        
+        # Editing the analyzer or detector source invalidates every cached result
+        self._cache_salt = repr([
+            os.path.getmtime(sys.modules[cls.__module__].__file__)
+            for cls in (CodeAnalyzer, ErrorDetector)
+        ]).encode('utf-8')
+        self._docs_salt = repr(os.path.getmtime(sys.modules[DocumentationGenerator.__module__].__file__))
         print("✅ Pipeline initialized successfully!\n")
     
     def analyze_single_file(self, file_path: str, output_dir: str = None, 
@@ -58,30 +145,54 @@ class CodeAnalysisPipeline:
         Returns:
             Complete analysis results
         """
-        print(f"📁 Analyzing file: {file_path}")
+        self._run_timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        self._show_file_details = True
+        try:
+            return self._analyze_file(file_path, output_dir, auto_fix, generate_docs)
+        finally:
+            self._flush_writes()
+    
+    def _analyze_file(self, file_path: str, output_dir: str, auto_fix: bool,
+                      generate_docs: bool) -> Dict[str, Any]:
+        """Analyze a single file, leaving its output files queued on the I/O pool"""
+        self._echo(f"📁 Analyzing file: {file_path}")
         
         if not os.path.exists(file_path):
             return {'error': f'File not found: {file_path}'}
         
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                code_content = f.read()
+            # Read raw bytes; large files are mapped so hashing and decoding work on the page cache directly
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > self.MMAP_THRESHOLD:
+                    source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    source = f.read()
             
-            # Perform comprehensive analysis
-            start_time = time.time()
-            analysis_results = self.analyzer.comprehensive_analysis(
-                code_content, file_path, auto_fix=auto_fix
-            )
-            analysis_time = time.time() - start_time
+            # Perform comprehensive analysis, reusing the cached result for unchanged files
+            try:
+                start_time = time.time()
+                source_key = self._source_key(source, file_path, auto_fix) if self.use_cache else None
+                cache_path = os.path.join(self.CACHE_DIR, f"{source_key}.json") if source_key else None
+                analysis_results = self._load_cached_result(cache_path) if cache_path else None
+                if analysis_results is None:
+                    analysis_results = self.analyzer.comprehensive_analysis(
+                        self._decode_source(source), file_path, auto_fix=auto_fix,
+                        language=self._language_for(file_path)
+                    )
+                    if cache_path and 'error' not in analysis_results:
+                        self._write_async(cache_path, dump_json(analysis_results))
+                analysis_time = time.time() - start_time
+            finally:
+                if isinstance(source, mmap.mmap):
+                    source.close()
             
             # Add timing information
             analysis_results['analysis_time'] = round(analysis_time, 2)
-            analysis_results['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            analysis_results['timestamp'] = self._run_timestamp
             
             # Generate documentation if requested
             if generate_docs and output_dir:
-                self._generate_documentation(analysis_results, output_dir, file_path)
+                self._generate_documentation(analysis_results, output_dir, file_path, source_key)
             
             # Save auto-fix results if available
             if auto_fix and analysis_results.get('comprehensive_analysis', {}).get('auto_fix'):
@@ -94,12 +205,12 @@ class CodeAnalysisPipeline:
             
         except Exception as e:
             error_msg = f"Analysis failed for {file_path}: {str(e)}"
-            print(f"❌ {error_msg}")
+            self._echo(f"❌ {error_msg}", detail=False)
             return {'error': error_msg, 'file_path': file_path}
     
     def analyze_directory(self, directory_path: str, output_dir: str = None,
                          auto_fix: bool = False, generate_docs: bool = True,
-                         file_extensions: List[str] = None) -> Dict[str, Any]:
+                         file_extensions: List[str] = None, workers: int = None) -> Dict[str, Any]:
         """
         Analyze all code files in a directory
         
@@ -109,9 +220,11 @@ class CodeAnalysisPipeline:
             auto_fix: Whether to automatically fix issues
             generate_docs: Whether to generate documentation
             file_extensions: List of file extensions to analyze
+            workers: Number of worker processes (defaults to the CPU count)
             
         Returns:
-            Combined analysis results for all files
+            Combined analysis results. Per-file results are in 'files_analyzed', or, when
+            output_dir is set, streamed to the JSONL file named by 'files_report'
         """
         print(f"📂 Analyzing directory: {directory_path}")
         
@@ -121,10 +234,12 @@ class CodeAnalysisPipeline:
         if file_extensions is None:
             file_extensions = ['.py', '.js', '.ts', '.java', '.cpp', '.c', '.cc', '.cxx']
         
+        # Every file of a run shares the run's timestamp
+        self._run_timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        self._show_file_details = self.verbose
         results = {
             'directory': directory_path,
-            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'files_analyzed': [],
+            'timestamp': self._run_timestamp,
             'summary': {
                 'total_files': 0,
                 'successful_analyses': 0,
@@ -137,48 +252,34 @@ class CodeAnalysisPipeline:
         }
         
         # Find all code files
-        code_files = []
-        for root, dirs, files in os.walk(directory_path):
-            # Skip virtual environment and other common directories
-            dirs[:] = [d for d in dirs if d not in ['venv', '.venv', 'env', '.env', 
-                                                  'node_modules', '.git', '__pycache__']]
-            
-            for file in files:
-                if any(file.endswith(ext) for ext in file_extensions):
-                    code_files.append(os.path.join(root, file))
+        # Extensions are matched without their dot, so both '.py' and 'py' are accepted
+        ext_set = frozenset(ext.lstrip('.').lower() for ext in file_extensions)
+        code_files = list(self._iter_code_files(directory_path, ext_set))
         
         print(f"Found {len(code_files)} code files to analyze")
         
+        # With an output directory, per-file results stream to a JSONL file instead of piling up in memory
+        files_out = None
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            results['files_report'] = os.path.join(output_dir, "directory_analysis_files.jsonl")
+            files_out = open(results['files_report'], 'wb')
+        else:
+            results['files_analyzed'] = []
+        
         # Analyze each file
         quality_scores = []
-        for file_path in code_files:
-            print(f"\n📄 Processing: {os.path.relpath(file_path, directory_path)}")
-            
-            file_result = self.analyze_single_file(
-                file_path, output_dir, auto_fix, generate_docs
-            )
-            
-            results['files_analyzed'].append(file_result)
-            results['summary']['total_files'] += 1
-            
-            if 'error' in file_result:
-                results['summary']['failed_analyses'] += 1
-            else:
-                results['summary']['successful_analyses'] += 1
-                
-                # Collect metrics
-                error_summary = file_result.get('error_analysis', {}).get('error_summary', {})
-                results['summary']['total_errors'] += error_summary.get('total_errors', 0)
-                results['summary']['total_warnings'] += error_summary.get('total_warnings', 0)
-                
-                quality_score = file_result.get('quality_score', 0)
-                if quality_score > 0:
-                    quality_scores.append(quality_score)
-                
-                # Check for auto-fixes
-                comprehensive = file_result.get('comprehensive_analysis', {})
-                if comprehensive.get('auto_fix_available'):
-                    results['summary']['files_with_auto_fixes'] += 1
+        file_results = self._analyze_files(
+            code_files, directory_path, output_dir, auto_fix, generate_docs, workers
+        )
+        if TQDM_AVAILABLE and not self.verbose:
+            file_results = tqdm(file_results, total=len(code_files), desc='Analyzing', unit='file')
+        try:
+            for file_result in file_results:
+                self._record_file_result(results, file_result, quality_scores, files_out)
+        finally:
+            if files_out is not None:
+                files_out.close()
         
         # Calculate average quality score
         if quality_scores:
@@ -189,40 +290,176 @@ class CodeAnalysisPipeline:
         # Generate combined report
         if output_dir:
             self._generate_directory_report(results, output_dir)
+        self._flush_writes()
         
         # Print directory summary
         self._print_directory_summary(results)
         
         return results
     
+    def _record_file_result(self, results: Dict[str, Any], file_result: Dict[str, Any],
+                            quality_scores: List[float], files_out=None):
+        """Fold one file's result into the directory summary and keep or stream the result itself"""
+        if files_out is None:
+            results['files_analyzed'].append(file_result)
+        else:
+            files_out.write(dump_json_line(file_result))
+        
+        results['summary']['total_files'] += 1
+        
+        if 'error' in file_result:
+            results['summary']['failed_analyses'] += 1
+        else:
+            results['summary']['successful_analyses'] += 1
+            
+            # Collect metrics
+            error_summary = file_result.get('error_analysis', {}).get('error_summary', {})
+            results['summary']['total_errors'] += error_summary.get('total_errors', 0)
+            results['summary']['total_warnings'] += error_summary.get('total_warnings', 0)
+            
+            quality_score = file_result.get('quality_score', 0)
+            if quality_score > 0:
+                quality_scores.append(quality_score)
+            
+            # Check for auto-fixes
+            comprehensive = file_result.get('comprehensive_analysis', {})
+            if comprehensive.get('auto_fix_available'):
+                results['summary']['files_with_auto_fixes'] += 1
+    
+    def _language_for(self, file_path: str) -> Optional[str]:
+        """Language implied by a file's extension, or None to let the analyzer inspect the content"""
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in self._languages_by_extension:
+            self._languages_by_extension[extension] = CodeAnalyzer.EXTENSION_MAP.get(extension[1:])
+        return self._languages_by_extension[extension]
+    
+    def _iter_code_files(self, directory_path: str, ext_set: frozenset):
+        """Yield code files under a directory, files of each directory before its subdirectories"""
+        try:
+            with os.scandir(directory_path) as entries:
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.EXCLUDED_DIRS:
+                            subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot + 1:].lower() in ext_set and not entry.is_dir():
+                        yield entry.path
+        except OSError:
+            return
+        
+        for subdir in subdirs:
+            yield from self._iter_code_files(subdir, ext_set)
+    
+    def _decode_source(self, source) -> str:
+        """Decode file bytes as text mode would; utf-8-sig drops a byte-order mark, which Python's parser rejects"""
+        code_content = str(source, 'utf-8-sig')
+        if '\r' in code_content:
+            code_content = code_content.replace('\r\n', '\n').replace('\r', '\n')
+        return code_content
+    
+    def _source_key(self, source, file_path: str, auto_fix: bool) -> str:
+        """Hash of a file's raw content, path, auto-fix mode and analyzer versions, naming its cached analysis"""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(repr((file_path, auto_fix, self._cache_salt)).encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(source)
+        return hasher.hexdigest()
+    
+    def _load_cached_result(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """Load a cached analysis result, or None if there is no usable entry"""
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            analysis_results = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except (OSError, ValueError):
+            return None
+        
+        # JSON turns the line-number keys of errors_by_line into strings; restore them
+        for error_analysis in (analysis_results.get('error_analysis'),
+                               analysis_results.get('comprehensive_analysis', {}).get('error_analysis')):
+            if error_analysis and 'error_summary' in error_analysis:
+                summary = error_analysis['error_summary']
+                summary['errors_by_line'] = {int(line): errors for line, errors in summary['errors_by_line'].items()}
+        return analysis_results
+    
+    def _analyze_files(self, code_files: List[str], directory_path: str, output_dir: str,
+                       auto_fix: bool, generate_docs: bool, workers: int = None):
+        """Yield analysis results for each file in order, using worker processes when it pays off"""
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(code_files) < 2:
+            for file_path in code_files:
+                self._echo(f"\n📄 Processing: {os.path.relpath(file_path, directory_path)}")
+                yield self._analyze_file(file_path, output_dir, auto_fix, generate_docs)
+            return
+        
+        # Files are independent; with fork, workers inherit this pipeline and its shared model weights
+        if "fork" in multiprocessing.get_all_start_methods():
+            # Only a model this process already loaded is shared; otherwise workers load it on
+            # their first summary, and runs that need none (cache hits, tiny files) never do
+            if self.analyzer.summarizer_loaded:
+                self.analyzer.share_models()
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=init_pipeline_worker,
+                initargs=(self,)
+            )
+        else:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_pipeline_worker,
+                initargs=(None, self.use_cache, self._run_timestamp, self.verbose)
+            )
+        
+        with pool:
+            yield from pool.map(
+                analyze_file_in_worker, code_files,
+                repeat(output_dir), repeat(auto_fix), repeat(generate_docs),
+                chunksize=4
+            )
+    
     def _generate_documentation(self, analysis_results: Dict[str, Any], 
-                              output_dir: str, file_path: str):
-        """Generate documentation files"""
+                              output_dir: str, file_path: str, source_key: str = None):
+        """Generate documentation files, skipping them when they already describe the same analysis"""
         try:
             os.makedirs(output_dir, exist_ok=True)
             filename = os.path.basename(file_path)
             base_name = os.path.splitext(filename)[0]
+            doc_paths = {
+                'markdown': os.path.join(output_dir, f"{base_name}_analysis.md"),
+                'html': os.path.join(output_dir, f"{base_name}_analysis.html"),
+                'json': os.path.join(output_dir, f"{base_name}_analysis.json")
+            }
             
-            # Generate different documentation formats
-            formats = ['markdown', 'html', 'json']
+            # The docs embed their generation time, so compare the inputs recorded in a sidecar instead
+            key_path = os.path.join(output_dir, f".{base_name}_analysis.key")
+            docs_key = f"{source_key}:{self._docs_salt}" if source_key else None
+            if docs_key and all(map(os.path.exists, doc_paths.values())):
+                try:
+                    with open(key_path, 'r', encoding='utf-8') as f:
+                        if f.read() == docs_key:
+                            self._echo(f"📝 Documentation up to date: {doc_paths['markdown']}")
+                            return
+                except OSError:
+                    pass
             
-            for fmt in formats:
-                doc_content = self.doc_generator.generate_documentation(analysis_results, fmt)
-                
-                if fmt == 'markdown':
-                    doc_path = os.path.join(output_dir, f"{base_name}_analysis.md")
-                elif fmt == 'html':
-                    doc_path = os.path.join(output_dir, f"{base_name}_analysis.html")
-                else:  # json
-                    doc_path = os.path.join(output_dir, f"{base_name}_analysis.json")
-                
-                with open(doc_path, 'w', encoding='utf-8') as f:
-                    f.write(doc_content)
+            # Generate all documentation formats from one pass over the analysis results
+            docs = self.doc_generator.generate_all(analysis_results)
+            
+            for fmt, doc_content in docs.items():
+                doc_path = doc_paths[fmt]
+                self._write_async(doc_path, dump_json(doc_content) if fmt == 'json' else doc_content)
                 
-                print(f"📝 Generated {fmt.upper()} documentation: {doc_path}")
+                self._echo(f"📝 Generated {fmt.upper()} documentation: {doc_path}")
+            
+            if docs_key:
+                self._write_async(key_path, docs_key)
             
         except Exception as e:
-            print(f"⚠️  Documentation generation failed: {e}")
+            self._echo(f"⚠️  Documentation generation failed: {e}", detail=False)
     
     def _save_fixed_code(self, analysis_results: Dict[str, Any], 
                         output_dir: str, file_path: str):
@@ -237,14 +474,13 @@ class CodeAnalysisPipeline:
                 base_name, ext = os.path.splitext(filename)
                 fixed_path = os.path.join(output_dir, f"{base_name}_fixed{ext}")
                 
-                with open(fixed_path, 'w', encoding='utf-8') as f:
-                    f.write(auto_fix['fixed_code'])
+                self._write_async(fixed_path, auto_fix['fixed_code'])
                 
-                print(f"🔧 Saved fixed code: {fixed_path}")
-                print(f"   Applied {len(auto_fix['fixes_applied'])} fixes")
+                self._echo(f"🔧 Saved fixed code: {fixed_path}\n"
+                           f"   Applied {len(auto_fix['fixes_applied'])} fixes")
             
         except Exception as e:
-            print(f"⚠️  Failed to save fixed code: {e}")
+            self._echo(f"⚠️  Failed to save fixed code: {e}", detail=False)
     
     def _generate_directory_report(self, results: Dict[str, Any], output_dir: str):
         """Generate a combined report for directory analysis"""
@@ -253,27 +489,64 @@ class CodeAnalysisPipeline:
             
             # Generate summary report
             report_path = os.path.join(output_dir, "directory_analysis_summary.json")
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, default=str)
+            self._write_async(report_path, dump_json(results))
             
             print(f"📊 Generated directory report: {report_path}")
             
             # Generate markdown summary
             md_report = self._create_markdown_summary(results)
             md_path = os.path.join(output_dir, "directory_analysis_summary.md")
-            with open(md_path, 'w', encoding='utf-8') as f:
-                f.write(md_report)
+            self._write_async(md_path, md_report)
             
             print(f"📝 Generated markdown summary: {md_path}")
             
         except Exception as e:
             print(f"⚠️  Failed to generate directory report: {e}")
     
+    def _echo(self, message: str, detail: bool = True):
+        """Print a progress message; per-file details are hidden during quiet directory runs"""
+        if detail and not self._show_file_details:
+            return
+        if TQDM_AVAILABLE:
+            # Keeps an active progress bar intact below the message
+            tqdm.write(message)
+        else:
+            print(message)
+    
+    def _write_async(self, path: str, content):
+        """Queue a file write on the I/O thread pool so analysis continues while it flushes"""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.IO_WORKERS)
+        self._pending_writes.append((path, self._io_pool.submit(atomic_write, path, content)))
+    
+    def _flush_writes(self):
+        """Wait for queued writes to finish and report any that failed"""
+        if self._io_pool is None:
+            return
+        self._io_pool.shutdown(wait=True)
+        self._io_pool = None
+        
+        # Cache entries are best-effort, so only report failed output files
+        for path, future in self._pending_writes:
+            if future.exception() is not None and not path.startswith(self.CACHE_DIR):
+                self._echo(f"⚠️  Failed to write {path}: {future.exception()}", detail=False)
+        self._pending_writes = []
+    
+    def _iter_file_results(self, results: Dict[str, Any]):
+        """Per-file results of a directory run, read back one at a time when they were streamed to disk"""
+        if 'files_analyzed' in results:
+            yield from results['files_analyzed']
+            return
+        
+        with open(results['files_report'], 'rb') as f:
+            for line in f:
+                yield orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+    
     def _create_markdown_summary(self, results: Dict[str, Any]) -> str:
         """Create a markdown summary of directory analysis"""
         summary = results['summary']
         
-        md_content = f"""# Directory Analysis Summary
+        parts = [f"""# Directory Analysis Summary
 
 **Directory:** `{results['directory']}`  
 **Analysis Date:** {results['timestamp']}
@@ -292,30 +565,37 @@ class CodeAnalysisPipeline:
 
 ## File Details
 
-"""
+"""]
         
-        for file_result in results['files_analyzed']:
+        # Collect fragments and join once; repeated += would copy the whole summary per file
+        for file_result in self._iter_file_results(results):
             if 'error' not in file_result:
                 filename = os.path.basename(file_result.get('filename', 'Unknown'))
                 quality = file_result.get('quality_score', 0)
                 language = file_result.get('language', 'Unknown')
                 
-                md_content += f"### {filename}\n"
-                md_content += f"- **Language:** {language}\n"
-                md_content += f"- **Quality Score:** {quality}/100\n"
-                md_content += f"- **Lines of Code:** {file_result.get('line_count', 0)}\n"
-                md_content += f"- **Complexity:** {file_result.get('complexity', 0)}\n"
+                parts.append(
+                    f"### {filename}\n"
+                    f"- **Language:** {language}\n"
+                    f"- **Quality Score:** {quality}/100\n"
+                    f"- **Lines of Code:** {file_result.get('line_count', 0)}\n"
+                    f"- **Complexity:** {file_result.get('complexity', 0)}\n"
+                )
                 
                 error_summary = file_result.get('error_analysis', {}).get('error_summary', {})
-                if error_summary.get('total_errors', 0) > 0 or error_summary.get('total_warnings', 0) > 0:
-                    md_content += f"- **Issues:** {error_summary.get('total_errors', 0)} errors, {error_summary.get('total_warnings', 0)} warnings\n"
+                total_errors = error_summary.get('total_errors', 0)
+                total_warnings = error_summary.get('total_warnings', 0)
+                if total_errors > 0 or total_warnings > 0:
+                    parts.append(f"- **Issues:** {total_errors} errors, {total_warnings} warnings\n")
                 
-                md_content += "\n"
+                parts.append("\n")
         
-        return md_content
+        return "".join(parts)
     
     def _print_analysis_summary(self, analysis_results: Dict[str, Any], file_path: str):
         """Print a summary of the analysis results"""
+        if not self._show_file_details:
+            return
         filename = os.path.basename(file_path)
         
         if 'error' in analysis_results:
@@ -363,6 +643,34 @@ class CodeAnalysisPipeline:
         print(f"Files with Auto-fixes: {summary['files_with_auto_fixes']}")
         print("=" * 60)
 
+# Pipeline of a directory-analysis worker process
+_worker_pipeline = None
+
+def init_pipeline_worker(pipeline: Optional[CodeAnalysisPipeline] = None, use_cache: bool = True,
+                         run_timestamp: str = None, verbose: bool = False):
+    """ProcessPoolExecutor initializer: adopt the parent's forked pipeline or build a new one"""
+    global _worker_pipeline
+    # One worker per CPU; torch's own intra-op threads would oversubscribe them
+    torch.set_num_threads(1)
+    if pipeline is None:
+        pipeline = CodeAnalysisPipeline(use_cache, verbose)
+        pipeline._run_timestamp = run_timestamp or pipeline._run_timestamp
+        pipeline._show_file_details = verbose
+    else:
+        # Threads of the parent (summary batcher, I/O pool) are not forked along with the pipeline
+        pipeline.analyzer.reset_after_fork()
+        pipeline.error_detector.reset_after_fork()
+        pipeline._io_pool = None
+        pipeline._pending_writes = []
+    _worker_pipeline = pipeline
+    # Output writes overlap the worker's next files and are flushed once, when the pool shuts it down
+    multiprocessing.util.Finalize(pipeline, pipeline._flush_writes, exitpriority=10)
+
+def analyze_file_in_worker(file_path: str, output_dir: str, auto_fix: bool,
+                           generate_docs: bool) -> Dict[str, Any]:
+    """Analyze one file with the worker process's pipeline, keeping the parent's run timestamp"""
+    return _worker_pipeline._analyze_file(file_path, output_dir, auto_fix, generate_docs)
+
 def create_argument_parser():
     """Create command line argument parser"""
     parser = argparse.ArgumentParser(
@@ -394,6 +702,8 @@ Examples:
                            help='Automatically fix detected issues')
     file_parser.add_argument('--no-docs', action='store_true',
                            help='Skip documentation generation')
+    file_parser.add_argument('--no-cache', action='store_true',
+                           help='Re-analyze instead of reusing cached results')
     
     # Directory analysis
     dir_parser = subparsers.add_parser('directory', help='Analyze a directory')
@@ -406,6 +716,12 @@ Examples:
     dir_parser.add_argument('--extensions', nargs='+', 
                           default=['.py', '.js', '.ts', '.java', '.cpp', '.c'],
                           help='File extensions to analyze')
+    dir_parser.add_argument('--workers', type=int, default=None,
+                          help='Number of worker processes (default: CPU count)')
+    dir_parser.add_argument('--no-cache', action='store_true',
+                          help='Re-analyze instead of reusing cached results')
+    dir_parser.add_argument('--verbose', '-v', action='store_true',
+                          help='Print per-file details instead of a progress bar')
     
     return parser
 
@@ -419,7 +735,7 @@ def main():
         return
     
     # Initialize pipeline
-    pipeline = CodeAnalysisPipeline()
+    pipeline = CodeAnalysisPipeline(use_cache=not args.no_cache, verbose=getattr(args, 'verbose', False))
     
     try:
         if args.command == 'file':
@@ -438,15 +754,15 @@ def main():
                 output_dir=args.output,
                 auto_fix=args.auto_fix,
                 generate_docs=not args.no_docs,
-                file_extensions=args.extensions
+                file_extensions=args.extensions,
+                workers=args.workers
             )
         
         # Save results if output directory specified
         if args.output and 'error' not in results:
             os.makedirs(args.output, exist_ok=True)
             results_path = os.path.join(args.output, 'analysis_results.json')
-            with open(results_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, default=str)
+            write_json(results_path, results)
             print(f"\n💾 Complete results saved to: {results_path}")
         
         print(f"\n🎉 Analysis pipeline completed successfully!")
@@ -1,14 +1,21 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any
 
+# Shared pydantic v2 config: immutable models that reject unknown fields
+MODEL_CONFIG = ConfigDict(frozen=True, extra='forbid', str_strip_whitespace=False, validate_assignment=False)
+
 
 class CodeAnalysisRequest(BaseModel):
+    model_config = MODEL_CONFIG
+    
     code: str
     filename: Optional[str] = None
     language: Optional[str] = None
 
 
 class FunctionInfo(BaseModel):
+    model_config = MODEL_CONFIG
+    
     name: str
     type: str
     parameters: Optional[List[str]] = None
@@ -18,6 +25,8 @@ class FunctionInfo(BaseModel):
 
 
 class ClassInfo(BaseModel):
+    model_config = MODEL_CONFIG
+    
     name: str
     type: str
     line_start: int
@@ -26,6 +35,8 @@ class ClassInfo(BaseModel):
 
 
 class CodeAnalysisResponse(BaseModel):
+    model_config = MODEL_CONFIG
+    
     language: str
     line_count: int
     complexity: int
@@ -37,12 +48,16 @@ class CodeAnalysisResponse(BaseModel):
 
 
 class DocumentationRequest(BaseModel):
+    model_config = MODEL_CONFIG
+    
     code: str
     filename: Optional[str] = None
     format: str = "markdown"  # markdown, html, json
 
 
 class DocumentationResponse(BaseModel):
+    model_config = MODEL_CONFIG
+    
     documentation: str
     format: str
     filename: Optional[str] = None
@@ -50,6 +65,8 @@ class DocumentationResponse(BaseModel):
 
 
 class HealthResponse(BaseModel):
+    model_config = MODEL_CONFIG
+    
     status: str
     version: str
     models_loaded: Dict[str, bool]
@@ -0,0 +1,36 @@
+"""
+Markers shared by the test scripts' reports; CI logs and NO_COLOR terminals get plain ASCII
+"""
+
+import os
+
+ASCII = bool(os.environ.get("CI") or os.environ.get("NO_COLOR"))
+
+# Marker name -> (emoji, ASCII stand-in)
+_MARKERS = {
+    "start": ("🚀", "=="),
+    "alert": ("🚨", "=="),
+    "section": ("📋", "##"),
+    "done": ("✅", "OK"),
+    "file": ("📁", "FILE"),
+    "lang": ("🔤", "LANG"),
+    "stats": ("📊", "##"),
+    "tools": ("🔧", "##"),
+    "complexity": ("🔄", "CX"),
+    "classes": ("🏗️", "##"),
+    "note": ("📝", "##"),
+    "score": ("⭐", "SCORE"),
+    "has_errors": ("❌", "ERR"),
+    "has_issues": ("⚠️ ", "WARN"),
+    "search": ("🔍", "##"),
+    "target": ("🎯", "##"),
+    "group": ("📂", "*"),
+    "line": ("📍", "@"),
+    "bullet": ("•", "-"),
+    "tip": ("💡", "->"),
+    "error": ("🔴", "[E]"),
+    "warning": ("🟡", "[W]"),
+    "info": ("🔵", "[I]"),
+}
+
+ICONS = {name: markers[ASCII] for name, markers in _MARKERS.items()}